@@ -0,0 +1,76 @@
+"""
+Microbenchmark for case-insensitive header lookups.
+
+This compares the current :class:`~view.core.headers.HTTPHeaders` against the
+``LowerStr``-keyed mapping that it replaced. Run it with::
+
+    $ python benchmarks/header_lookup.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from view.core.headers import CONTENT_TYPE, HTTPHeaders
+from view.core.multi_map import MultiMap
+
+HEADERS = [
+    ("Host", "example.com"),
+    ("User-Agent", "Mozilla/5.0"),
+    ("Accept", "text/html"),
+    ("Accept-Encoding", "gzip, br"),
+    ("Accept-Language", "en-US"),
+    ("Connection", "keep-alive"),
+    ("Content-Type", "application/json"),
+    ("Cookie", "session=1234"),
+]
+NUMBER = 1_000_000
+
+
+class LowerStr(str):
+    """
+    The string subclass previously used for header names.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, data: object) -> LowerStr:
+        if isinstance(data, str):
+            data = data.lower()
+        return super().__new__(cls, data)
+
+    def __eq__(self, string: object) -> bool:
+        if isinstance(string, str):
+            string = string.lower()
+        return super().__eq__(string)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+class LowerStrHeaders(MultiMap[str, str]):
+    __slots__ = ()
+
+    def __getitem__(self, key: str, /) -> str:
+        return super().__getitem__(LowerStr(key))
+
+
+def bench(name: str, statement: str, namespace: dict[str, object]) -> None:
+    seconds = min(timeit.repeat(statement, globals=namespace, number=NUMBER))
+    print(f"{name:<40} {seconds / NUMBER * 1e9:8.1f} ns per lookup")
+
+
+def main() -> None:
+    old = LowerStrHeaders((LowerStr(key), value) for key, value in HEADERS)
+    new = HTTPHeaders(HEADERS)
+    namespace = {"old": old, "new": new, "CONTENT_TYPE": CONTENT_TYPE}
+
+    bench("LowerStr, lowercase literal", "old['content-type']", namespace)
+    bench("LowerStr, mixed case literal", "old['Content-Type']", namespace)
+    bench("HTTPHeaders, lowercase literal", "new['content-type']", namespace)
+    bench("HTTPHeaders, mixed case literal", "new['Content-Type']", namespace)
+    bench("HTTPHeaders, interned constant", "new[CONTENT_TYPE]", namespace)
+
+
+if __name__ == "__main__":
+    main()
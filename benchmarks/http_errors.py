@@ -0,0 +1,70 @@
+"""
+Microbenchmark for rejecting requests with an HTTP error.
+
+This compares a view that raises :class:`~view.core.status_codes.NotFound`
+against one that returns it, both going through
+:meth:`~view.core.app.App.process_request`. Logging is disabled, so only
+the cost of the error path itself is measured. Run it with::
+
+    $ python benchmarks/http_errors.py
+
+Run it with ``python -O`` as well to see the cost without debug-only
+extras, such as the traceback note attached to raised errors.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+from loguru import logger
+
+from view.core.app import App
+from view.core.headers import HTTPHeaders
+from view.core.request import Method, Request
+from view.core.status_codes import NotFound
+
+NUMBER = 50_000
+
+
+async def no_body() -> AsyncIterator[bytes]:
+    yield b""
+
+
+app = App()
+
+
+@app.get("/raised")
+async def raised():
+    raise NotFound
+
+
+@app.get("/returned")
+async def returned():
+    return NotFound
+
+
+async def measure(path: str) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(NUMBER):
+            request = Request.from_server(
+                no_body, app, path, Method.GET, HTTPHeaders()
+            )
+            await app.process_request(request)
+        best = min(best, time.perf_counter() - start)
+
+    return best / NUMBER
+
+
+async def main() -> None:
+    logger.remove()
+    for path in ["/raised", "/returned", "/unrouted"]:
+        per_request = await measure(path)
+        print(f"{path:>10}: {per_request * 1e6:>6.2f} us per request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+"""
+Microbenchmark for the memory use and lookup speed of
+:class:`~view.core.multi_map.MultiMap` at typical sizes.
+
+This compares the compact representation, which is searched linearly,
+against the dictionary index that maps with more than ``COMPACT_SIZE``
+entries build. Run it with::
+
+    $ python benchmarks/multi_map.py
+"""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+from typing import ClassVar
+
+from view.core.multi_map import MultiMap
+
+SIZES = [1, 2, 4, 8, 16]
+MAPS = 10_000
+NUMBER = 1_000_000
+
+
+class CompactMultiMap(MultiMap[str, str]):
+    """
+    Multi-map that never builds its dictionary index for lookups.
+    """
+
+    __slots__ = ()
+    COMPACT_SIZE: ClassVar[int] = max(SIZES)
+
+
+class IndexedMultiMap(MultiMap[str, str]):
+    """
+    Multi-map that always builds its dictionary index.
+    """
+
+    __slots__ = ()
+    COMPACT_SIZE: ClassVar[int] = -1
+
+
+def allocated(
+    cls: type[MultiMap[str, str]], items: list[tuple[str, str]]
+) -> float:
+    tracemalloc.start()
+    maps = [cls(items) for _ in range(MAPS)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del maps
+    return size / MAPS
+
+
+def lookup(multi_map: MultiMap[str, str], key: str) -> float:
+    namespace = {"multi_map": multi_map, "key": key}
+    seconds = min(
+        timeit.repeat("multi_map[key]", globals=namespace, number=NUMBER)
+    )
+    return seconds / NUMBER * 1e9
+
+
+def contains(multi_map: MultiMap[str, str], key: str) -> float:
+    namespace = {"multi_map": multi_map, "key": key}
+    seconds = min(
+        timeit.repeat("key in multi_map", globals=namespace, number=NUMBER)
+    )
+    return seconds / NUMBER * 1e9
+
+
+def main() -> None:
+    print(
+        f"{'entries':>7} {'map':>8} {'bytes':>8} "
+        f"{'first ns':>9} {'last ns':>8} {'miss ns':>8}"
+    )
+    for size in SIZES:
+        items = [
+            (f"key-{number}", f"value-{number}") for number in range(size)
+        ]
+        first = items[0][0]
+        last = items[-1][0]
+        for kind, cls in (
+            ("compact", CompactMultiMap),
+            ("indexed", IndexedMultiMap),
+        ):
+            multi_map = cls(items)
+            print(
+                f"{size:>7} {kind:>8} {allocated(cls, items):>8.0f} "
+                f"{lookup(multi_map, first):>9.1f} "
+                f"{lookup(multi_map, last):>8.1f} "
+                f"{contains(multi_map, 'missing'):>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
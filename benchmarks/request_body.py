@@ -0,0 +1,79 @@
+"""
+Microbenchmark for reading a request body into memory.
+
+This compares :meth:`~view.core.body.BodyMixin.body` against the
+``BytesIO`` buffer that it used to write every chunk into, for bodies of a
+few typical sizes. Run it with::
+
+    $ python benchmarks/request_body.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from io import BytesIO
+
+from view.core.app import App
+from view.core.headers import HTTPHeaders
+from view.core.request import Method, Request
+
+CHUNK_SIZE = 64 * 1024
+SIZES = [1024, 1024 * 1024, 10 * 1024 * 1024]
+REPEAT = 20
+
+
+def stream_of(size: int, chunk_size: int) -> AsyncIterator[bytes]:
+    chunks = [
+        bytes(min(chunk_size, size - offset))
+        for offset in range(0, size, chunk_size)
+    ]
+
+    async def receive_data() -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+
+    return receive_data
+
+
+async def read_bytesio(request: Request) -> bytes:
+    buffer = BytesIO()
+    async for data in request.stream_body():
+        buffer.write(data)
+
+    return buffer.getvalue()
+
+
+async def read_body(request: Request) -> bytes:
+    return await request.body()
+
+
+async def measure(read, size: int, chunk_size: int) -> float:
+    app = App()
+    receive_data = stream_of(size, chunk_size)
+    best = float("inf")
+    for _ in range(REPEAT):
+        request = Request.from_server(
+            receive_data, app, "/", Method.POST, HTTPHeaders()
+        )
+        start = time.perf_counter()
+        await read(request)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+async def main() -> None:
+    for size in SIZES:
+        for chunk_size in sorted({min(CHUNK_SIZE, size), size}):
+            old = await measure(read_bytesio, size, chunk_size)
+            new = await measure(read_body, size, chunk_size)
+            print(
+                f"{size:>10} bytes in {-(-size // chunk_size):>3} chunks"
+                f"  BytesIO {old * 1e6:>9.1f} us  body() {new * 1e6:>9.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
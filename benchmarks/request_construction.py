@@ -0,0 +1,59 @@
+"""
+Microbenchmark for constructing :class:`~view.core.request.Request` objects.
+
+This compares the dataclass constructor, :meth:`Request.from_server` (used by
+the ASGI and WSGI bridges), and reusing requests through a
+:class:`~view.core.request.RequestPool`. Run it with::
+
+    $ python benchmarks/request_construction.py
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import AsyncIterator
+
+from view.core.app import App
+from view.core.headers import HTTPHeaders
+from view.core.request import Method, Request, RequestPool
+
+NUMBER = 1_000_000
+
+
+async def receive_data() -> AsyncIterator[bytes]:
+    yield b""
+
+
+def main() -> None:
+    app = App()
+    headers = HTTPHeaders()
+    pool = RequestPool()
+    namespace = {
+        "Request": Request,
+        "Method": Method,
+        "receive_data": receive_data,
+        "app": app,
+        "headers": headers,
+        "pool": pool,
+    }
+    statements = {
+        "Request()": "Request(receive_data, app, '/a/b', Method.GET, headers)",
+        "Request.from_server()": (
+            "Request.from_server(receive_data, app, '/a/b', Method.GET, headers)"
+        ),
+        "Request.from_server(), trailing /": (
+            "Request.from_server(receive_data, app, '/a/b/', Method.GET, headers)"
+        ),
+        "RequestPool.acquire() and release()": (
+            "pool.release(pool.acquire(receive_data, app, '/a/b', Method.GET, headers))"
+        ),
+    }
+    for name, statement in statements.items():
+        seconds = min(
+            timeit.repeat(statement, globals=namespace, number=NUMBER)
+        )
+        print(f"{name:<36} {NUMBER / seconds:>12,.0f} per second")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Microbenchmark for turning constant response headers into ASGI headers.
+
+This compares a plain dictionary, which goes through
+:func:`~view.core.headers.as_real_headers` and is encoded again for every
+response, against a module-level
+:class:`~view.core.headers.FrozenHTTPHeaders`. Run it with::
+
+    $ python benchmarks/response_headers.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from view.core.headers import (
+    FrozenHTTPHeaders,
+    as_real_headers,
+    headers_to_asgi,
+)
+
+HEADERS = {
+    "content-type": "application/json",
+    "cache-control": "no-store",
+    "x-frame-options": "DENY",
+    "x-content-type-options": "nosniff",
+}
+FROZEN = FrozenHTTPHeaders(HEADERS)
+NUMBER = 200_000
+
+
+def from_dict() -> None:
+    headers_to_asgi(as_real_headers(HEADERS))
+
+
+def from_frozen() -> None:
+    headers_to_asgi(as_real_headers(FROZEN))
+
+
+def main() -> None:
+    for name, function in [("dict", from_dict), ("frozen", from_frozen)]:
+        best = min(timeit.repeat(function, number=NUMBER, repeat=5))
+        print(f"{name:>6}: {best / NUMBER * 1e9:>7.1f} ns per response")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
 from view.core import app as app
+from view.core import compression as compression
+from view.core import events as events
 from view.core import headers as headers
+from view.core import json_codec as json_codec
+from view.core import multipart as multipart
+from view.core import parameters as parameters
 from view.core import request as request
 from view.core import response as response
 from view.core import router as router
+from view.core import static as static
 from view.core import status_codes as status_codes
+from view.core import validation as validation
@@ -7,11 +7,15 @@ from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable, Iterator
 from multiprocessing import Process
 from pathlib import Path
-from typing import TYPE_CHECKING, ParamSpec, TypeAlias, TypeVar
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeAlias, TypeVar
 
 from loguru import logger
 
-from view.core.request import Method, Request
+from view.core.body import InvalidJSONError
+from view.core.compression import CompressionSettings, compress_response
+from view.core.headers import ACCEPT_ENCODING
+from view.core.json_codec import DEFAULT_CODEC, JSONCodec
+from view.core.request import Method, Request, RequestPool
 from view.core.response import (
     FileResponse,
     Response,
@@ -20,12 +24,15 @@ from view.core.response import (
     wrap_view_result,
 )
 from view.core.router import FoundRoute, Route, Router, RouteView
+from view.core.static import PrecompressedFiles, StaticFileCache
 from view.core.status_codes import (
+    BadRequest,
     Forbidden,
     HTTPError,
     InternalServerError,
     NotFound,
 )
+from view.core.validation import ValidationError, Validator
 from view.exceptions import InvalidTypeError
 from view.utils import reraise
 
@@ -49,6 +56,23 @@ class BaseApp(ABC):
             "The current request being handled."
         )
         self._production: bool | None = None
+        self.compression: CompressionSettings | None = None
+        """
+        Settings for compressing responses, or ``None`` if responses
+        should never be compressed.
+        """
+        self.json_codec: JSONCodec = DEFAULT_CODEC
+        """
+        Codec used for JSON request bodies and responses. This defaults to
+        the fastest JSON library that's installed.
+        """
+        self.max_body_size: int | None = None
+        """
+        Maximum size of a request body in bytes, or ``None`` for no limit.
+        Larger bodies are rejected with
+        :class:`~view.core.status_codes.ContentTooLarge` as soon as
+        the limit is crossed.
+        """
 
     @property
     def debug(self) -> bool:
@@ -94,6 +118,18 @@ class BaseApp(ABC):
         Get the response from the server for a given request.
         """
 
+    async def finalize_response(
+        self, request: Request, response: Response
+    ) -> Response:
+        """
+        Apply app-wide transformations, such as compression, to a response
+        before it's sent to the client.
+        """
+        if self.compression is not None:
+            return await compress_response(response, request, self.compression)
+
+        return response
+
     def wsgi(self) -> WSGIProtocol:
         """
         Get the WSGI callable for the app.
@@ -102,13 +138,24 @@ class BaseApp(ABC):
 
         return wsgi_for_app(self)
 
-    def asgi(self) -> ASGIProtocol:
+    def asgi(
+        self,
+        *,
+        coalesce_size: int = 0,
+        request_pool: RequestPool | None = None,
+    ) -> ASGIProtocol:
         """
         Get the ASGI callable for the app.
+
+        Streamed body chunks are gathered into writes of up to
+        ``coalesce_size`` bytes. See :class:`~view.core.request.RequestPool`
+        for reusing request objects.
         """
         from view.run.asgi import asgi_for_app
 
-        return asgi_for_app(self)
+        return asgi_for_app(
+            self, coalesce_size=coalesce_size, request_pool=request_pool
+        )
 
     def run(
         self,
@@ -174,25 +221,52 @@ class BaseApp(ABC):
         return process
 
 
+ErrorResult: TypeAlias = "HTTPError | type[HTTPError]"
+
+
+def _is_error(result: object) -> bool:
+    return isinstance(result, HTTPError) or (
+        isinstance(result, type) and issubclass(result, HTTPError)
+    )
+
+
+def _error_response(error: ErrorResult) -> Response:
+    if isinstance(error, HTTPError):
+        return error.as_response()
+
+    return error.default_response()
+
+
 async def _execute_view_internal(
     view: Callable[P, ViewResult],
     *args: P.args,
     **kwargs: P.kwargs,
-) -> Response:
-    logger.debug(f"Executing view: {view}")
+) -> Response | ErrorResult:
+    if __debug__:
+        logger.debug(f"Executing view: {view}")
+
     try:
         result = view(*args, **kwargs)
+        if isinstance(result, Awaitable):
+            result = await result
+
+        # Returned errors are handed back as-is, so that they never have
+        # to be instantiated or raised.
+        if _is_error(result):
+            return result
+
         return await wrap_view_result(result)
     except HTTPError as error:
-        logger.opt(colors=True).info(
-            f"<red>HTTP Error {error.status_code}</red>"
-        )
+        if __debug__:
+            logger.opt(colors=True).info(
+                f"<red>HTTP Error {error.status_code}</red>"
+            )
         raise
 
 
-async def execute_view(
+async def _execute_view_or_error(
     view: Callable[P, ViewResult], *args: P.args, **kwargs: P.kwargs
-) -> Response:
+) -> Response | ErrorResult:
     try:
         return await _execute_view_internal(view, *args, **kwargs)
     except BaseException as exception:
@@ -207,6 +281,30 @@ async def execute_view(
         raise InternalServerError from exception
 
 
+async def execute_view(
+    view: Callable[P, ViewResult], *args: P.args, **kwargs: P.kwargs
+) -> Response:
+    """
+    Call a view and turn its result into a response. HTTP errors that are
+    raised by the view are propagated, while errors that are returned by it
+    are converted into their response.
+    """
+    result = await _execute_view_or_error(view, *args, **kwargs)
+    if isinstance(result, Response):
+        return result
+
+    return _error_response(result)
+
+
+async def _validate_body(request: Request, validator: Validator) -> Any:
+    try:
+        return validator(await request.json())
+    except InvalidJSONError as error:
+        raise BadRequest("Request body is not valid JSON") from error
+    except ValidationError as error:
+        raise BadRequest(f"Invalid request body: {error}") from error
+
+
 SingleView = Callable[["Request"], ViewResult]
 
 
@@ -223,9 +321,11 @@ class SingleViewApp(BaseApp):
     async def process_request(self, request: Request) -> Response:
         with self.request_context(request):
             try:
-                return await execute_view(self.view, request)
+                response = await execute_view(self.view, request)
             except HTTPError as error:
-                return error.as_response()
+                response = error.as_response()
+
+            return await self.finalize_response(request, response)
 
 
 def as_app(view: SingleView, /) -> SingleViewApp:
@@ -251,11 +351,24 @@ class App(BaseApp):
     and error handling.
     """
 
-    def __init__(self, *, router: Router | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        router: Router | None = None,
+        compression: CompressionSettings | None = None,
+        max_body_size: int | None = None,
+        json_codec: JSONCodec | None = None,
+    ) -> None:
         super().__init__()
         self.router = router or Router()
-
-    async def _process_request_internal(self, request: Request) -> Response:
+        self.compression = compression
+        self.max_body_size = max_body_size
+        if json_codec is not None:
+            self.json_codec = json_codec
+
+    async def _process_request_internal(
+        self, request: Request
+    ) -> Response | ErrorResult:
         logger.opt(colors=True).info(
             f"<yellow>{request.method}</yellow> <green>{request.path}</green>"
         )
@@ -263,26 +376,73 @@ class App(BaseApp):
             request.path, request.method
         )
         if found_route is None:
-            raise NotFound
+            return NotFound
 
         # Extend instead of replacing?
         request.path_parameters = found_route.path_parameters
-        return await execute_view(found_route.route.view)
+        route = found_route.route
+        if route.max_body_size is not None:
+            request.max_body_size = route.max_body_size
+
+        if route.body_validator is not None:
+            request.validated_body = await _validate_body(
+                request, route.body_validator
+            )
+
+        if route.bind_arguments is None:
+            return await _execute_view_or_error(route.view)
+
+        return await _execute_view_or_error(
+            route.view, **route.bind_arguments(request)
+        )
 
     async def process_request(self, request: Request) -> Response:
         with self.request_context(request):
             try:
-                return await self._process_request_internal(request)
+                result = await self._process_request_internal(request)
             except HTTPError as error:
-                error_view = self.router.lookup_error(type(error))
+                result = error
+
+            if isinstance(result, Response):
+                response = result
+            else:
+                # Raised and returned errors are handled the same way.
+                error_type = (
+                    result if isinstance(result, type) else type(result)
+                )
+                error_view = self.router.lookup_error(error_type)
                 if error_view is not None:
-                    return await execute_view(error_view)
+                    response = await execute_view(error_view)
+                else:
+                    response = _error_response(result)
 
-                return error.as_response()
+            return await self.finalize_response(request, response)
 
-    def route(self, path: str, /, *, method: Method) -> RouteDecorator:
+    def route(
+        self,
+        path: str,
+        /,
+        *,
+        method: Method,
+        max_body_size: int | None = None,
+        body: Any = None,
+    ) -> RouteDecorator:
         """
         Decorator interface for adding a route to the app.
+
+        ``max_body_size`` overrides the app's request body size limit for
+        this route. If ``body`` is a model, such as a dataclass or
+        :class:`~typing.TypedDict`, the JSON body is validated against it
+        before the view is called and stored on
+        :attr:`~view.core.request.Request.validated_body`. Bodies that don't
+        match are rejected with
+        :class:`~view.core.status_codes.BadRequest`.
+
+        The view may declare parameters for the request, path parameters,
+        the body model, and values marked with
+        :class:`~view.core.parameters.Query` or
+        :class:`~view.core.parameters.Header`. These are resolved once,
+        when the route is registered.
         """
 
         if __debug__ and not isinstance(path, str):
@@ -292,63 +452,173 @@ class App(BaseApp):
             raise InvalidTypeError(method, Method)
 
         def decorator(view: RouteView, /) -> Route:
-            return self.router.push_route(view, path, method)
+            return self.router.push_route(
+                view, path, method, max_body_size=max_body_size, body=body
+            )
 
         return decorator
 
-    def get(self, path: str, /) -> RouteDecorator:
+    def get(
+        self,
+        path: str,
+        /,
+        *,
+        max_body_size: int | None = None,
+        body: Any = None,
+    ) -> RouteDecorator:
         """
         Decorator interface for adding a GET route.
         """
-        return self.route(path, method=Method.GET)
+        return self.route(
+            path,
+            method=Method.GET,
+            max_body_size=max_body_size,
+            body=body,
+        )
 
-    def post(self, path: str, /) -> RouteDecorator:
+    def post(
+        self,
+        path: str,
+        /,
+        *,
+        max_body_size: int | None = None,
+        body: Any = None,
+    ) -> RouteDecorator:
         """
         Decorator interface for adding a POST route.
         """
-        return self.route(path, method=Method.POST)
+        return self.route(
+            path,
+            method=Method.POST,
+            max_body_size=max_body_size,
+            body=body,
+        )
 
-    def put(self, path: str, /) -> RouteDecorator:
+    def put(
+        self,
+        path: str,
+        /,
+        *,
+        max_body_size: int | None = None,
+        body: Any = None,
+    ) -> RouteDecorator:
         """
         Decorator interface for adding a PUT route.
         """
-        return self.route(path, method=Method.PUT)
+        return self.route(
+            path,
+            method=Method.PUT,
+            max_body_size=max_body_size,
+            body=body,
+        )
 
-    def patch(self, path: str, /) -> RouteDecorator:
+    def patch(
+        self,
+        path: str,
+        /,
+        *,
+        max_body_size: int | None = None,
+        body: Any = None,
+    ) -> RouteDecorator:
         """
         Decorator interface for adding a PATCH route.
         """
-        return self.route(path, method=Method.PATCH)
+        return self.route(
+            path,
+            method=Method.PATCH,
+            max_body_size=max_body_size,
+            body=body,
+        )
 
-    def delete(self, path: str, /) -> RouteDecorator:
+    def delete(
+        self,
+        path: str,
+        /,
+        *,
+        max_body_size: int | None = None,
+        body: Any = None,
+    ) -> RouteDecorator:
         """
         Decorator interface for adding a DELETE route.
         """
-        return self.route(path, method=Method.DELETE)
+        return self.route(
+            path,
+            method=Method.DELETE,
+            max_body_size=max_body_size,
+            body=body,
+        )
 
-    def connect(self, path: str, /) -> RouteDecorator:
+    def connect(
+        self,
+        path: str,
+        /,
+        *,
+        max_body_size: int | None = None,
+        body: Any = None,
+    ) -> RouteDecorator:
         """
         Decorator interface for adding a CONNECT route.
         """
-        return self.route(path, method=Method.CONNECT)
+        return self.route(
+            path,
+            method=Method.CONNECT,
+            max_body_size=max_body_size,
+            body=body,
+        )
 
-    def options(self, path: str, /) -> RouteDecorator:
+    def options(
+        self,
+        path: str,
+        /,
+        *,
+        max_body_size: int | None = None,
+        body: Any = None,
+    ) -> RouteDecorator:
         """
         Decorator interface for adding an OPTIONS route.
         """
-        return self.route(path, method=Method.OPTIONS)
+        return self.route(
+            path,
+            method=Method.OPTIONS,
+            max_body_size=max_body_size,
+            body=body,
+        )
 
-    def trace(self, path: str, /) -> RouteDecorator:
+    def trace(
+        self,
+        path: str,
+        /,
+        *,
+        max_body_size: int | None = None,
+        body: Any = None,
+    ) -> RouteDecorator:
         """
         Decorator interface for adding a TRACE route.
         """
-        return self.route(path, method=Method.TRACE)
+        return self.route(
+            path,
+            method=Method.TRACE,
+            max_body_size=max_body_size,
+            body=body,
+        )
 
-    def head(self, path: str, /) -> RouteDecorator:
+    def head(
+        self,
+        path: str,
+        /,
+        *,
+        max_body_size: int | None = None,
+        body: Any = None,
+    ) -> RouteDecorator:
         """
         Decorator interface for adding a HEAD route.
         """
-        return self.route(path, method=Method.HEAD)
+        return self.route(
+            path,
+            method=Method.HEAD,
+            max_body_size=max_body_size,
+            body=body,
+        )
 
     def error(
         self, status: int | type[HTTPError], /
@@ -384,14 +654,40 @@ class App(BaseApp):
 
         return decorator
 
-    def static_files(self, path: str, directory: str | Path) -> None:
+    def static_files(
+        self,
+        path: str,
+        directory: str | Path,
+        *,
+        precompressed: bool = True,
+        cache: StaticFileCache | None = None,
+    ) -> None:
+        """
+        Serve the files in a directory under the given route.
+
+        If ``precompressed`` is ``True``, then ``.br``, ``.zst`` and ``.gz``
+        siblings of a file are served in its place when the client accepts
+        that encoding. See :func:`~view.core.static.precompress_directory`
+        for building them.
+
+        If a :class:`~view.core.static.StaticFileCache` is given, small files
+        are kept in memory and served from there.
+        """
         if __debug__ and not isinstance(directory, (str, Path)):
             raise InvalidTypeError(directory, str, Path)
 
         directory = Path(directory)
+        variants = PrecompressedFiles() if precompressed else None
 
         @self.subrouter(path)
-        def serve_static_file(path_from_url: str) -> ResponseLike:
+        async def serve_static_file(path_from_url: str) -> ResponseLike:
+            request = self.current_request()
+            accept_encoding = request.headers.get(ACCEPT_ENCODING, "")
+            if cache is not None:
+                cached = cache.get(path_from_url, accept_encoding)
+                if cached is not None:
+                    return cached
+
             file = directory / path_from_url
             if not file.is_file():
                 raise NotFound
@@ -400,4 +696,17 @@ class App(BaseApp):
                 raise Forbidden
 
             with reraise(Forbidden, OSError):
+                codings = (
+                    () if variants is None else variants.codings_for(file)
+                )
+                if cache is not None:
+                    cached = await cache.load(
+                        path_from_url, file, codings, accept_encoding
+                    )
+                    if cached is not None:
+                        return cached
+
+                if variants is not None:
+                    return variants.file_response(file, accept_encoding)
+
                 return FileResponse.from_file(file)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import codecs
 import json
-from collections.abc import AsyncIterator, Callable
+import re
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
 from dataclasses import dataclass, field
-from io import BytesIO
 from typing import Any, TypeAlias
 
+from view.core.json_codec import JSONCodec, current_codec
 from view.exceptions import InvalidTypeError, ViewError
 
 __all__ = ("BodyMixin",)
@@ -34,6 +36,159 @@ class InvalidJSONError(ViewError):
     """
 
 
+def _item_too_large() -> Exception:
+    # Avoid circular import issues
+    from view.core.status_codes import ContentTooLarge
+
+    return ContentTooLarge()
+
+
+async def _decode_json_lines(
+    chunks: AsyncIterator[bytes],
+    decode: Callable[[bytes], Any],
+    max_item_size: int | None,
+) -> AsyncIterator[Any]:
+    pending: list[bytes] = []
+    pending_size = 0
+
+    def parse(line: bytes) -> Any:
+        try:
+            return decode(line)
+        except Exception as error:
+            raise InvalidJSONError("Failed to parse JSON") from error
+
+    async for data in chunks:
+        if b"\n" not in data:
+            pending.append(data)
+            pending_size += len(data)
+            if max_item_size is not None and pending_size > max_item_size:
+                raise _item_too_large()
+            continue
+
+        lines = data.split(b"\n")
+        if pending:
+            pending.append(lines[0])
+            lines[0] = b"".join(pending)
+            pending.clear()
+
+        # The last line might continue in the next chunk.
+        last = lines.pop()
+        pending.append(last)
+        pending_size = len(last)
+        for line in lines:
+            if max_item_size is not None and len(line) > max_item_size:
+                raise _item_too_large()
+            if line.strip():
+                yield parse(line)
+
+    tail = b"".join(pending)
+    if tail.strip():
+        yield parse(tail)
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CONTINUATION = re.compile(r"[0-9.eE+-]*")
+
+
+async def _decode_json_array(
+    chunks: AsyncIterator[bytes], max_item_size: int | None
+) -> AsyncIterator[Any]:
+    # Elements are found with the standard library's raw_decode(), since
+    # it's the only parser that reports where a value ends.
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    text = ""
+    position = 0
+    at_end = False
+    started = False
+    expect_value = True
+    first = True
+    # After a failed attempt, wait until the unparsed text has doubled
+    # before trying again, so a large element isn't parsed over and over.
+    retry_size = 0
+
+    while True:
+        position = _WHITESPACE.match(text, position).end()  # type: ignore[union-attr]
+        remaining = len(text) - position
+        if remaining and not started:
+            if text[position] != "[":
+                raise InvalidJSONError("Expected a JSON array")
+
+            started = True
+            position += 1
+            continue
+
+        if remaining and not expect_value:
+            character = text[position]
+            if character == ",":
+                expect_value = True
+                position += 1
+                continue
+
+            if character == "]":
+                break
+
+            raise InvalidJSONError(f"Expected ',' or ']', got {character!r}")
+
+        if remaining and expect_value and (at_end or remaining >= retry_size):
+            if text[position] == "]":
+                if not first:
+                    raise InvalidJSONError("Trailing comma in JSON array")
+                break
+
+            try:
+                value, end = decoder.raw_decode(text, position)
+            except json.JSONDecodeError as error:
+                if at_end:
+                    raise InvalidJSONError("Failed to parse JSON") from error
+                retry_size = remaining * 2
+            else:
+                # A number might continue in the next chunk, as long as
+                # everything after it could still be part of it, such as
+                # the "." in "2." or the "e" in "1e".
+                if (
+                    at_end
+                    or type(value) not in {int, float}
+                    or _NUMBER_CONTINUATION.fullmatch(text, end) is None
+                ):
+                    yield value
+                    position = end
+                    expect_value = False
+                    first = False
+                    retry_size = 0
+                    continue
+
+                retry_size = remaining + 1
+
+        if at_end:
+            raise InvalidJSONError("Body ended before the end of the array")
+
+        if max_item_size is not None and remaining > max_item_size:
+            raise _item_too_large()
+
+        text = text[position:]
+        position = 0
+        try:
+            data = await chunks.__anext__()
+        except StopAsyncIteration:
+            at_end = True
+            data = b""
+
+        try:
+            text += utf8.decode(data, final=at_end)
+        except UnicodeDecodeError as error:
+            raise InvalidJSONError(
+                "Body does not contain valid UTF-8 data"
+            ) from error
+
+    # Nothing but whitespace may follow the array.
+    rest = text[position + 1 :].strip()
+    async for data in chunks:
+        rest = rest or data.strip()
+    if rest:
+        raise InvalidJSONError("Unexpected data after JSON array")
+
+
 @dataclass(slots=True)
 class BodyMixin:
     """
@@ -43,31 +198,80 @@ class BodyMixin:
     receive_data: BodyStream
     consumed: bool = field(init=False, default=False)
 
-    async def body(self) -> bytes:
+    def _body_limit(self) -> int | None:
         """
-        Read the full body from the stream.
+        Maximum number of bytes that the body may contain, or ``None`` if
+        it's unlimited.
         """
+        return None
+
+    async def _read_chunks(self) -> AsyncGenerator[bytes, None]:
         if self.consumed:
             raise BodyAlreadyUsedError
 
         self.consumed = True
+        limit = self._body_limit()
+        received = 0
+
+        stream = self.receive_data()
+        try:
+            async for data in stream:
+                if __debug__ and not isinstance(data, bytes):
+                    raise InvalidTypeError(data, bytes)
+
+                if limit is not None:
+                    received += len(data)
+                    if received > limit:
+                        # Avoid circular import issues
+                        from view.core.status_codes import ContentTooLarge
+
+                        raise ContentTooLarge
+
+                yield data
+        finally:
+            # Stopping early has to stop whatever produces the stream too,
+            # instead of leaving it suspended until it's garbage collected.
+            close = getattr(stream, "aclose", None)
+            if close is not None:
+                await close()
+
+    async def body(self) -> bytes:
+        """
+        Read the full body from the stream.
+        """
+        chunks = [data async for data in self._read_chunks()]
+
+        if len(chunks) == 1:
+            # Most bodies arrive in one piece, so there's nothing to copy.
+            return chunks[0]
 
-        buffer = BytesIO()
-        async for data in self.receive_data():
-            if __debug__ and not isinstance(data, bytes):
-                raise InvalidTypeError(data, bytes)
-            buffer.write(data)
+        # Unlike a growing buffer, this copies every chunk exactly once into
+        # a result of the right size.
+        return b"".join(chunks)
 
-        return buffer.getvalue()
+    def _json_codec(self) -> JSONCodec:
+        return current_codec()
 
     async def json(
-        self, *, parse_function: Callable[[str], dict[str, Any]] = json.loads
+        self,
+        *,
+        parse_function: Callable[[str], dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """
         Read the body as JSON data.
+
+        By default, the body is parsed straight from bytes with the app's
+        :attr:`~view.core.app.BaseApp.json_codec`. If a ``parse_function`` is
+        given, the body is decoded to a string and passed to it instead.
         """
 
         data = await self.body()
+        if parse_function is None:
+            try:
+                return self._json_codec().decode(data)
+            except Exception as error:
+                raise InvalidJSONError("Failed to parse JSON") from error
+
         try:
             text = data.decode("utf-8")
         except UnicodeDecodeError as error:
@@ -80,17 +284,58 @@ class BodyMixin:
         except Exception as error:
             raise InvalidJSONError("Failed to parse JSON") from error
 
-    async def stream_body(self) -> AsyncIterator[bytes]:
+    async def json_stream(
+        self,
+        *,
+        ndjson: bool | None = None,
+        max_item_size: int | None = 1024 * 1024,
+    ) -> AsyncIterator[Any]:
         """
-        Incrementally stream the body, not keeping the whole thing
-        in-memory at a given time.
+        Incrementally parse the body as either the elements of a top-level
+        JSON array, or as newline-delimited JSON (NDJSON) records, yielding
+        each one as soon as it has arrived.
+
+        If ``ndjson`` is ``None``, the format is detected from the first
+        non-whitespace byte of the body: a ``[`` means a JSON array, and
+        anything else means NDJSON. This only works when NDJSON records
+        aren't arrays themselves, so pass ``ndjson=True`` for those.
+
+        Only one element is buffered at a time, and elements larger than
+        ``max_item_size`` bytes are rejected with
+        :class:`~view.core.status_codes.ContentTooLarge`.
         """
-        if self.consumed:
-            raise BodyAlreadyUsedError
+        chunks = self._read_chunks()
+        head: list[bytes] = []
+        if ndjson is None:
+            async for data in chunks:
+                head.append(data)
+                stripped = data.lstrip()
+                if stripped:
+                    ndjson = not stripped.startswith(b"[")
+                    break
+            else:
+                return
 
-        self.consumed = True
+        async def replay() -> AsyncIterator[bytes]:
+            for data in head:
+                yield data
+
+            async for data in chunks:
+                yield data
+
+        if ndjson:
+            items = _decode_json_lines(
+                replay(), self._json_codec().decode, max_item_size
+            )
+        else:
+            items = _decode_json_array(replay(), max_item_size)
+
+        async for item in items:
+            yield item
 
-        async for data in self.receive_data():
-            if __debug__ and not isinstance(data, bytes):
-                raise InvalidTypeError(data, bytes)
-            yield data
+    def stream_body(self) -> AsyncGenerator[bytes, None]:
+        """
+        Incrementally stream the body, not keeping the whole thing
+        in-memory at a given time.
+        """
+        return self._read_chunks()
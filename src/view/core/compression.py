@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import zlib
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Protocol, TypeAlias
+
+from view.core.headers import (
+    ACCEPT_ENCODING,
+    CACHE_CONTROL,
+    CONTENT_ENCODING,
+    CONTENT_LENGTH,
+    CONTENT_TYPE,
+    ETAG,
+    VARY,
+    HTTPHeaders,
+)
+from view.core.response import JSONResponse, Response, TextResponse
+
+if TYPE_CHECKING:
+    from view.core.request import Request
+
+__all__ = (
+    "AVAILABLE_ENCODINGS",
+    "CompressionSettings",
+    "compress_response",
+    "negotiate_encoding",
+)
+
+
+class Compressor(Protocol):
+    """
+    Protocol for an incremental compressor.
+    """
+
+    def compress(self, data: bytes, /) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+CompressorFactory: TypeAlias = Callable[[int], Compressor]
+
+
+def _gzip_compressor(level: int) -> Compressor:
+    # A window size of 16 + MAX_WBITS tells zlib to write a gzip container.
+    return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+AVAILABLE_ENCODINGS: dict[str, CompressorFactory] = {
+    "gzip": _gzip_compressor,
+}
+"""
+Content codings that can be used in this environment, mapped to a function
+that creates an incremental compressor for a given level.
+"""
+
+try:
+    import brotli
+except ImportError:
+    pass
+else:
+
+    @dataclass(slots=True)
+    class _BrotliCompressor:
+        compressor: brotli.Compressor
+
+        def compress(self, data: bytes, /) -> bytes:
+            return self.compressor.process(data)
+
+        def flush(self) -> bytes:
+            return self.compressor.finish()
+
+    def _brotli_compressor(level: int) -> Compressor:
+        return _BrotliCompressor(brotli.Compressor(quality=level))
+
+    AVAILABLE_ENCODINGS["br"] = _brotli_compressor
+
+if sys.version_info >= (3, 14):
+    from compression import zstd
+
+    def _zstd_compressor(level: int) -> Compressor:
+        return zstd.ZstdCompressor(level=level)
+
+    AVAILABLE_ENCODINGS["zstd"] = _zstd_compressor
+else:
+    try:
+        import zstandard
+    except ImportError:
+        pass
+    else:
+
+        def _zstd_compressor(level: int) -> Compressor:
+            return zstandard.ZstdCompressor(level=level).compressobj()
+
+        AVAILABLE_ENCODINGS["zstd"] = _zstd_compressor
+
+
+DEFAULT_COMPRESSIBLE_TYPES = frozenset(
+    {
+        "text/html",
+        "text/plain",
+        "text/css",
+        "text/csv",
+        "text/javascript",
+        "text/markdown",
+        "text/xml",
+        "application/javascript",
+        "application/json",
+        "application/ld+json",
+        "application/manifest+json",
+        "application/x-ndjson",
+        "application/xml",
+        "image/svg+xml",
+    }
+)
+
+
+_DEFAULT_LEVELS: dict[str, int] = {"gzip": 6, "br": 4, "zstd": 3}
+
+
+@dataclass(slots=True, frozen=True)
+class CompressionSettings:
+    """
+    Settings for compressing responses based on the client's
+    ``Accept-Encoding`` header.
+    """
+
+    minimum_size: int = 500
+    """
+    Responses with a known size smaller than this (in bytes) are sent
+    uncompressed, because the framing overhead outweighs the savings.
+    """
+
+    levels: Mapping[str, int] = field(
+        default_factory=lambda: dict(_DEFAULT_LEVELS)
+    )
+    """
+    Compression level to use for each content coding. Codings that are
+    missing from this use their default level.
+    """
+
+    content_types: frozenset[str] = DEFAULT_COMPRESSIBLE_TYPES
+    """
+    Media types (without parameters) that are eligible for compression.
+    """
+
+    encodings: Sequence[str] = ("zstd", "br", "gzip")
+    """
+    Content codings that the server is willing to use, in order of
+    preference. Codings that aren't installed are ignored.
+    """
+
+    offload_size: int = 256 * 1024
+    """
+    Data at least this large (in bytes) is compressed in a worker thread
+    instead of on the event loop.
+    """
+
+
+def negotiate_encoding(
+    accept_encoding: str, available: Sequence[str], /
+) -> str | None:
+    """
+    Pick the best content coding out of ``available`` for the given
+    ``Accept-Encoding`` header value, or ``None`` if the client didn't
+    accept any of them.
+
+    Ties in quality are broken by the order of ``available``.
+    """
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, *parameters = part.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        for parameter in parameters:
+            name, _, value = parameter.partition("=")
+            if name.strip().lower() != "q":
+                continue
+
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+
+        qualities[coding] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    best: str | None = None
+    best_quality = 0.0
+    for coding in available:
+        quality = qualities.get(coding, wildcard)
+        if quality > best_quality:
+            best = coding
+            best_quality = quality
+
+    return best
+
+
+def _media_type(response: Response) -> str | None:
+    content_type = response.headers.get(CONTENT_TYPE)
+    if content_type is not None:
+        return content_type.partition(";")[0].strip().lower()
+
+    if isinstance(response, JSONResponse):
+        return "application/json"
+
+    if isinstance(response, TextResponse):
+        return "text/plain"
+
+    return None
+
+
+def _with_vary(items: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    for key, value in items:
+        if key != VARY:
+            continue
+
+        varies = {part.strip().lower() for part in value.split(",")}
+        if "*" in varies or "accept-encoding" in varies:
+            return items
+
+    return [*items, (VARY, ACCEPT_ENCODING)]
+
+
+def _encoded_items(
+    items: list[tuple[str, str]], coding: str
+) -> list[tuple[str, str]]:
+    # The compressed body is a different representation, so it can't share
+    # a strong validator with the original one. This matches the tags given
+    # to precompressed static files. A precomputed length, such as one from
+    # a cached static file, would describe the uncompressed body.
+    result: list[tuple[str, str]] = []
+    for key, value in items:
+        if key == CONTENT_LENGTH:
+            continue
+
+        if key == ETAG and value.endswith('"'):
+            result.append((key, f'{value[:-1]}-{coding}"'))
+        else:
+            result.append((key, value))
+
+    result.append((CONTENT_ENCODING, coding))
+    return result
+
+
+async def _compress_all(
+    compressor: Compressor, data: bytes, offload_size: int
+) -> bytes:
+    def compress() -> bytes:
+        return compressor.compress(data) + compressor.flush()
+
+    if len(data) >= offload_size:
+        return await asyncio.to_thread(compress)
+
+    return compress()
+
+
+async def compress_response(
+    response: Response, request: Request, settings: CompressionSettings
+) -> Response:
+    """
+    Compress a response according to the request's ``Accept-Encoding``
+    header. Responses that can't or shouldn't be compressed are returned
+    unchanged.
+
+    In-memory responses are compressed in one shot, while anything else is
+    compressed incrementally as it's streamed.
+    """
+    if response.long_lived:
+        # Compressors buffer their input, which would hold events back.
+        return response
+
+    status = response.status_code
+    if status < 200 or status in {204, 304}:  # noqa: PLR2004
+        return response
+
+    headers = response.headers
+    if CONTENT_ENCODING in headers:
+        return response
+
+    if "no-transform" in headers.get(CACHE_CONTROL, "").lower():
+        return response
+
+    if _media_type(response) not in settings.content_types:
+        return response
+
+    items = _with_vary(list(headers.as_sequence()))
+    coding = negotiate_encoding(
+        request.headers.get(ACCEPT_ENCODING, ""),
+        [name for name in settings.encodings if name in AVAILABLE_ENCODINGS],
+    )
+    if coding is None:
+        return replace(response, headers=HTTPHeaders(items))
+
+    create_compressor = AVAILABLE_ENCODINGS[coding]
+    level = settings.levels.get(coding, _DEFAULT_LEVELS.get(coding, 6))
+    if isinstance(response, (TextResponse, JSONResponse)):
+        body = await response.body()
+        if len(body) < settings.minimum_size:
+            return TextResponse.from_content(
+                body, status_code=status, headers=HTTPHeaders(items)
+            )
+
+        compressor = create_compressor(level)
+        compressed = await _compress_all(
+            compressor, body, settings.offload_size
+        )
+        return TextResponse.from_content(
+            compressed,
+            status_code=status,
+            headers=HTTPHeaders(_encoded_items(items, coding)),
+        )
+
+    length = headers.get(CONTENT_LENGTH)
+    if length is not None:
+        try:
+            size = int(length)
+        except ValueError:
+            # Treat a malformed length as unknown.
+            size = None
+
+        if size is not None and size < settings.minimum_size:
+            return replace(response, headers=HTTPHeaders(items))
+
+    compressor = create_compressor(level)
+    offload_size = settings.offload_size
+
+    async def stream() -> AsyncIterator[bytes]:
+        async for data in response.stream_body():
+            if len(data) >= offload_size:
+                compressed = await asyncio.to_thread(compressor.compress, data)
+            else:
+                compressed = compressor.compress(data)
+
+            if compressed:
+                yield compressed
+
+        yield compressor.flush()
+
+    return Response(stream, status, HTTPHeaders(_encoded_items(items, coding)))
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from dataclasses import dataclass, field
+from typing import ClassVar, TypeAlias
+
+from view.core.headers import (
+    CACHE_CONTROL,
+    CONTENT_TYPE,
+    HeadersLike,
+    HTTPHeaders,
+    as_real_headers,
+)
+from view.core.response import Response
+
+__all__ = (
+    "EventBroadcaster",
+    "EventStreamResponse",
+    "ServerSentEvent",
+)
+
+HEARTBEAT = b": heartbeat\n\n"
+"""
+Comment line sent to keep an idle event stream open. Clients ignore it.
+"""
+
+_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+
+@dataclass(slots=True, frozen=True)
+class ServerSentEvent:
+    """
+    A single event in a ``text/event-stream`` response.
+    """
+
+    data: str
+    """
+    The payload of the event. Line breaks are allowed, and are sent as
+    multiple ``data`` lines.
+    """
+
+    event: str | None = None
+    """
+    The event type, which defaults to ``message`` on the client.
+    """
+
+    id: str | None = None
+    """
+    The event ID, which the client sends back in ``Last-Event-ID`` when it
+    reconnects.
+    """
+
+    retry: int | None = None
+    """
+    How long the client should wait before reconnecting, in milliseconds.
+    """
+
+    def encode(self) -> bytes:
+        """
+        Serialize this event in the event stream format.
+        """
+        lines: list[str] = []
+        if self.event is not None:
+            lines.append(f"event: {_single_line(self.event, 'event')}\n")
+
+        if self.id is not None:
+            lines.append(f"id: {_single_line(self.id, 'id')}\n")
+
+        if self.retry is not None:
+            lines.append(f"retry: {self.retry}\n")
+
+        lines.extend(
+            f"data: {line}\n" for line in _LINE_BREAK.split(self.data)
+        )
+
+        lines.append("\n")
+        return "".join(lines).encode()
+
+
+def _single_line(value: str, name: str) -> str:
+    if _LINE_BREAK.search(value) is not None:
+        raise ValueError(f"The {name} of an event can't contain line breaks")
+
+    return value
+
+
+EventLike: TypeAlias = ServerSentEvent | str | bytes
+"""
+Something that can be sent on an event stream: an event, a string that's
+used as the data of an event, or an event that was already encoded.
+"""
+
+
+def _encode_event(event: EventLike) -> bytes:
+    if isinstance(event, bytes):
+        return event
+
+    if isinstance(event, str):
+        if _LINE_BREAK.search(event) is None:
+            # By far the most common case, so skip building an event.
+            return f"data: {event}\n\n".encode()
+
+        event = ServerSentEvent(event)
+
+    return event.encode()
+
+
+async def _as_async_iterator(
+    events: Iterable[EventLike],
+) -> AsyncIterator[EventLike]:
+    for event in events:
+        yield event
+
+
+@dataclass(slots=True)
+class EventStreamResponse(Response):
+    """
+    Server-Sent Events response, streamed to the client as events are
+    produced.
+
+    Each event is sent as soon as it's available, and the producer is
+    cancelled when the client disconnects, which is detected through the
+    ASGI ``http.disconnect`` message. These responses are never compressed,
+    since that would hold events back in the compressor.
+    """
+
+    long_lived: ClassVar[bool] = True
+
+    @classmethod
+    def from_events(
+        cls,
+        events: AsyncIterable[EventLike] | Iterable[EventLike],
+        /,
+        *,
+        heartbeat: float | None = 15.0,
+        status_code: int = 200,
+        headers: HeadersLike | None = None,
+    ) -> EventStreamResponse:
+        """
+        Generate an :class:`EventStreamResponse` from a synchronous or
+        asynchronous iterable of events.
+
+        If no event was produced for ``heartbeat`` seconds, a comment is
+        sent to keep proxies from closing the idle connection. Pass
+        ``None`` to disable heartbeats.
+        """
+        iterator: AsyncIterator[EventLike] = (
+            events.__aiter__()
+            if isinstance(events, AsyncIterable)
+            else _as_async_iterator(events)
+        )
+
+        async def stream() -> AsyncIterator[bytes]:
+            if heartbeat is None:
+                try:
+                    async for event in iterator:
+                        yield _encode_event(event)
+                finally:
+                    await _close(iterator)
+                return
+
+            pending: asyncio.Future[EventLike] | None = None
+            try:
+                while True:
+                    if pending is None:
+                        pending = asyncio.ensure_future(iterator.__anext__())
+
+                    # Waiting doesn't cancel the producer on a timeout, so
+                    # the same pending event is waited on again afterwards.
+                    done, _ = await asyncio.wait({pending}, timeout=heartbeat)
+                    if not done:
+                        yield HEARTBEAT
+                        continue
+
+                    try:
+                        event = pending.result()
+                    except StopAsyncIteration:
+                        return
+                    finally:
+                        pending = None
+
+                    yield _encode_event(event)
+            finally:
+                if pending is not None:
+                    # The producer has to stop running before it can be
+                    # closed.
+                    pending.cancel()
+                    await asyncio.wait({pending})
+                await _close(iterator)
+
+        items = list(as_real_headers(headers).as_sequence())
+        names = {key for key, _ in items}
+        if CONTENT_TYPE not in names:
+            items.append((CONTENT_TYPE, "text/event-stream"))
+        if CACHE_CONTROL not in names:
+            items.append((CACHE_CONTROL, "no-cache"))
+
+        return cls(stream, status_code, HTTPHeaders(items))
+
+
+async def _close(iterator: AsyncIterator[EventLike]) -> None:
+    close = getattr(iterator, "aclose", None)
+    if close is not None:
+        await close()
+
+
+@dataclass(slots=True)
+class EventBroadcaster:
+    """
+    Hub that sends the same events to many event streams at once.
+
+    Every published event is encoded exactly once, and the encoded bytes
+    are shared by all subscribers. Each subscriber has a bounded queue; a
+    subscriber that falls more than ``max_pending`` events behind is
+    disconnected, so one slow client can't make the hub buffer without
+    limit. Clients are expected to reconnect, using ``Last-Event-ID`` to
+    catch up.
+    """
+
+    max_pending: int = 64
+    """
+    Maximum number of events that may be waiting to be sent to a single
+    subscriber.
+    """
+
+    _subscribers: set[asyncio.Queue[bytes | None]] = field(
+        default_factory=set, repr=False
+    )
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def _disconnect(self, queue: asyncio.Queue[bytes | None]) -> None:
+        self._subscribers.discard(queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def publish(self, event: EventLike) -> None:
+        """
+        Send an event to every current subscriber.
+        """
+        data = _encode_event(event)
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(data)
+            except asyncio.QueueFull:
+                self._disconnect(queue)
+
+    def close(self) -> None:
+        """
+        End the event stream of every current subscriber.
+        """
+        for queue in list(self._subscribers):
+            self._disconnect(queue)
+
+    async def subscribe(self) -> AsyncIterator[bytes]:
+        """
+        Receive every event that's published from now on, already encoded.
+
+        The subscription starts once iteration starts, and ends when the
+        iterator is closed or the broadcaster disconnects it.
+        """
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(self.max_pending)
+        self._subscribers.add(queue)
+        try:
+            while True:
+                data = await queue.get()
+                if data is None:
+                    return
+
+                yield data
+        finally:
+            self._subscribers.discard(queue)
+
+    def response(
+        self,
+        *,
+        heartbeat: float | None = 15.0,
+        headers: HeadersLike | None = None,
+    ) -> EventStreamResponse:
+        """
+        Create an event stream response that's subscribed to this hub.
+        """
+        return EventStreamResponse.from_events(
+            self.subscribe(), heartbeat=heartbeat, headers=headers
+        )
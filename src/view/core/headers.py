@@ -1,78 +1,260 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import sys
+from collections.abc import Iterable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any, TypeAlias
 
-from typing_extensions import Self
-
-from view.core.multi_map import MultiMap
+from view.core.multi_map import (
+    _MISSING,
+    MultiMap,
+    MutableMultiMap,
+)
 from view.exceptions import InvalidTypeError
 
 if TYPE_CHECKING:
     from view.run.asgi import ASGIHeaders
-    from view.run.wsgi import WSGIHeaders
 
 __all__ = (
+    "FrozenHTTPHeaders",
     "HTTPHeaders",
     "HeadersLike",
+    "LazyHTTPHeaders",
+    "MutableHTTPHeaders",
     "as_real_headers",
     "asgi_to_headers",
+    "header_name",
     "headers_to_asgi",
     "wsgi_to_headers",
 )
 
 
-class LowerStr(str):
+# Header names are normalized to lowercase strings, and names that match
+# one of these constants are replaced by it, so a lookup that uses a
+# constant compares by identity. Other names come from clients and aren't
+# interned, since interned strings may never be freed.
+ACCEPT = sys.intern("accept")
+ACCEPT_ENCODING = sys.intern("accept-encoding")
+AUTHORIZATION = sys.intern("authorization")
+CACHE_CONTROL = sys.intern("cache-control")
+CONNECTION = sys.intern("connection")
+CONTENT_DISPOSITION = sys.intern("content-disposition")
+CONTENT_ENCODING = sys.intern("content-encoding")
+CONTENT_LENGTH = sys.intern("content-length")
+CONTENT_TYPE = sys.intern("content-type")
+COOKIE = sys.intern("cookie")
+ETAG = sys.intern("etag")
+HOST = sys.intern("host")
+IF_MODIFIED_SINCE = sys.intern("if-modified-since")
+IF_NONE_MATCH = sys.intern("if-none-match")
+LAST_MODIFIED = sys.intern("last-modified")
+LOCATION = sys.intern("location")
+ORIGIN = sys.intern("origin")
+REFERER = sys.intern("referer")
+SET_COOKIE = sys.intern("set-cookie")
+TRANSFER_ENCODING = sys.intern("transfer-encoding")
+USER_AGENT = sys.intern("user-agent")
+VARY = sys.intern("vary")
+X_FORWARDED_FOR = sys.intern("x-forwarded-for")
+
+_KNOWN_NAMES: dict[str, str] = {
+    name: name
+    for name in (
+        ACCEPT,
+        ACCEPT_ENCODING,
+        AUTHORIZATION,
+        CACHE_CONTROL,
+        CONNECTION,
+        CONTENT_DISPOSITION,
+        CONTENT_ENCODING,
+        CONTENT_LENGTH,
+        CONTENT_TYPE,
+        COOKIE,
+        ETAG,
+        HOST,
+        IF_MODIFIED_SINCE,
+        IF_NONE_MATCH,
+        LAST_MODIFIED,
+        LOCATION,
+        ORIGIN,
+        REFERER,
+        SET_COOKIE,
+        TRANSFER_ENCODING,
+        USER_AGENT,
+        VARY,
+        X_FORWARDED_FOR,
+    )
+}
+_KNOWN_RAW_NAMES: dict[bytes, str] = {
+    name.encode("ascii"): name for name in _KNOWN_NAMES
+}
+
+
+def header_name(name: str, /) -> str:
+    """
+    Normalize a header name to its lowercase form. Well-known names are
+    returned as the shared constant for that name.
+    """
+    lowered = name.lower()
+    return _KNOWN_NAMES.get(lowered, lowered)
+
+
+def _decode_header_name(name: bytes, /) -> str:
+    known = _KNOWN_RAW_NAMES.get(name)
+    if known is not None:
+        return known
+
+    return header_name(name.decode("utf-8"))
+
+
+class HTTPHeaders(MultiMap[str, str]):
     """
-    A string that always acts in lowercase. This is useful for case-insensitive
-    comparisons.
+    Case-insensitive multi-map of HTTP headers.
+
+    Header names are normalized through :func:`header_name` when the map is
+    created, so lookups with a well-known name constant compare by
+    identity.
     """
 
     __slots__ = ()
 
-    def __new__(cls, data: object) -> Self:
-        return super().__new__(cls, cls._to_lower(data))
+    def __init__(self, items: Iterable[tuple[str, str]] = ()) -> None:
+        super().__init__((header_name(key), value) for key, value in items)
 
-    @staticmethod
-    def _to_lower(data: object) -> object:
-        if isinstance(data, str):
-            data = data.lower()
+    def _normalize_key(self, key: str) -> str:
+        return header_name(key)
 
-        return data
+    # Lookups are tried with the key as given first, because that's
+    # almost always one of the interned lowercase constants. The base
+    # methods are called directly to skip the cost of super().
 
-    def __contains__(self, key: str, /) -> bool:
-        return super().__contains__(key.lower())
+    def _first(self, key: Any) -> str | Any:
+        value = MultiMap._first(self, key)  # noqa: SLF001
+        if value is _MISSING and isinstance(key, str):
+            return MultiMap._first(self, key.lower())  # noqa: SLF001
 
-    def __eq__(self, string: object) -> bool:
-        return super().__eq__(self._to_lower(string))
+        return value
 
-    def __ne__(self, value: object, /) -> bool:
-        return super().__ne__(self._to_lower(value))
+    def _lookup(self, key: Any) -> Sequence[str] | None:
+        values = MultiMap._lookup(self, key)  # noqa: SLF001
+        if values is None and isinstance(key, str):
+            return MultiMap._lookup(self, key.lower())  # noqa: SLF001
 
-    def __hash__(self) -> int:
-        return hash(str(self))
+        return values
 
+    def with_new_value(self, key: str, value: str) -> HTTPHeaders:
+        new_sequence = [*self.as_sequence(), (key, value)]
+        return HTTPHeaders(new_sequence)
 
-class HTTPHeaders(MultiMap[str, str]):
+
+class MutableHTTPHeaders(HTTPHeaders, MutableMultiMap[str, str]):
     """
-    Case-insensitive multi-map of HTTP headers.
+    Case-insensitive multi-map of HTTP headers that can be modified in place.
+
+    This is meant for building up response headers, where copying the whole
+    map for every new header would be wasteful.
+    """
+
+    __slots__ = ()
+
+
+class FrozenHTTPHeaders(HTTPHeaders):
     """
+    Case-insensitive multi-map of HTTP headers that's meant to be created
+    once, such as at module level, and then reused for every response.
 
-    def __getitem__(self, key: str, /) -> str:
-        return super().__getitem__(LowerStr(key))
+    These are passed through :func:`as_real_headers` as-is, and their ASGI
+    encoding is computed on first use and cached, so constant headers are
+    never converted again.
+    """
 
-    def __contains__(self, key: object, /) -> bool:
-        return super().__contains__(LowerStr(key))
+    __slots__ = ("_asgi",)
 
-    def __repr__(self) -> str:
-        return f"HTTPHeaders({self.as_sequence()})"
+    def __init__(
+        self, items: Iterable[tuple[str, str]] | Mapping[str, str] = ()
+    ) -> None:
+        if isinstance(items, Mapping):
+            items = items.items()
 
-    def get_exactly_one(self, key: str) -> str:
-        return super().get_exactly_one(LowerStr(key))
+        super().__init__(items)
+        self._asgi: tuple[tuple[bytes, bytes], ...] | None = None
 
-    def with_new_value(self, key: str, value: str) -> HTTPHeaders:
-        new_sequence = [*list(self.as_sequence()), (LowerStr(key), value)]
-        return type(self)(new_sequence)
+    def encode_asgi(self) -> tuple[tuple[bytes, bytes], ...]:
+        """
+        Get these headers as ASGI ``(name, value)`` byte pairs. They're
+        encoded on the first call, and the same tuple is returned
+        afterwards.
+        """
+        encoded = self._asgi
+        if encoded is None:
+            encoded = tuple(
+                (key.encode("utf-8"), value.encode("utf-8"))
+                for key, value in self.as_sequence()
+            )
+            self._asgi = encoded
+
+        return encoded
+
+
+class LazyHTTPHeaders(HTTPHeaders):
+    """
+    Case-insensitive multi-map of HTTP headers, backed by the raw
+    ``(name, value)`` byte pairs given by an ASGI server.
+
+    Header values are only decoded when they're looked up, and each lookup
+    is cached. The full mapping is only decoded when an operation needs all
+    the headers at once, such as iteration. The original list is available
+    through the ``raw`` attribute.
+
+    As the ASGI specification requires, the raw names must already be
+    lowercase.
+    """
+
+    __slots__ = ("_cache", "raw")
+
+    def __init__(self, raw: list[tuple[bytes, bytes]]) -> None:
+        # Intentionally don't call super().__init__(), the decoded map gets
+        # populated by __getattr__ on first use.
+        self.raw = raw
+        self._cache: dict[str, list[str]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in MultiMap.__slots__:
+            raise AttributeError(name)
+
+        MultiMap.__init__(
+            self,
+            [
+                (_decode_header_name(key), value.decode("utf-8"))
+                for key, value in self.raw
+            ],
+        )
+        return getattr(self, name)
+
+    def _lookup(self, key: Any) -> Sequence[str] | None:
+        if not isinstance(key, str):
+            return None
+
+        values = self._cache.get(key)
+        if values is None:
+            name = header_name(key)
+            values = self._cache.get(name)
+            if values is None:
+                encoded = name.encode("utf-8")
+                values = [
+                    value.decode("utf-8")
+                    for raw_name, value in self.raw
+                    if raw_name == encoded
+                ]
+                self._cache[name] = values
+
+        return values or None
+
+    def _first(self, key: Any) -> str | Any:
+        values = self._lookup(key)
+        if values is None:
+            return _MISSING
+
+        return values[0]
 
 
 HeadersLike: TypeAlias = (
@@ -84,9 +266,15 @@ def as_real_headers(headers: HeadersLike | None, /) -> HTTPHeaders:
     """
     Convenience function for casting a "header-like object" (or ``None``)
     to a :class:`MultiMap`.
+
+    :class:`HTTPHeaders` objects (including :class:`FrozenHTTPHeaders`)
+    are returned as-is, and anything else is converted to a new
+    :class:`MutableHTTPHeaders` object. Views that return the same headers
+    for every response should use a :class:`FrozenHTTPHeaders` constant
+    to skip this conversion.
     """
     if headers is None:
-        return HTTPHeaders()
+        return MutableHTTPHeaders()
 
     if isinstance(headers, HTTPHeaders):
         return headers
@@ -95,7 +283,7 @@ def as_real_headers(headers: HeadersLike | None, /) -> HTTPHeaders:
         raise InvalidTypeError(Mapping, headers)
 
     assert isinstance(headers, dict)
-    all_values: list[tuple[LowerStr, str]] = []
+    all_values: list[tuple[str, str]] = []
 
     for key, value in headers.items():
         if isinstance(key, bytes):
@@ -104,60 +292,62 @@ def as_real_headers(headers: HeadersLike | None, /) -> HTTPHeaders:
         if isinstance(value, bytes):
             value = value.decode("utf-8")  # noqa: PLW2901
 
-        all_values.append((LowerStr(key), value))
+        all_values.append((key, value))
 
-    return HTTPHeaders(all_values)
+    return MutableHTTPHeaders(all_values)
 
 
 def wsgi_to_headers(environ: Mapping[str, Any]) -> HTTPHeaders:
     """
     Convert WSGI headers (from the ``environ``) to a case-insensitive multi-map.
     """
-    values: list[tuple[LowerStr, str]] = []
+    values: list[tuple[str, str]] = []
 
     for key, value in environ.items():
         if not key.startswith("HTTP_"):
             continue
 
         assert isinstance(value, str)
-        key = key.removeprefix("HTTP_").replace("_", "-").lower()  # noqa: PLW2901
-        values.append((LowerStr(key), value))
+        key = key.removeprefix("HTTP_").replace("_", "-")  # noqa: PLW2901
+        values.append((key, value))
 
     return HTTPHeaders(values)
 
 
-def headers_to_wsgi(headers: HTTPHeaders, /) -> WSGIHeaders:
+def headers_to_wsgi(headers: HTTPHeaders, /) -> list[tuple[str, str]]:
     """
     Convert a case-insensitive multi-map to a WSGI header iterable.
     """
+    return list(headers.as_sequence())
 
-    wsgi_headers: WSGIHeaders = []
-    for key, value in headers.items():
-        wsgi_headers.append((str(key), value))
-
-    return wsgi_headers
 
-
-def asgi_to_headers(headers: ASGIHeaders, /) -> HTTPHeaders:
+def asgi_to_headers(headers: ASGIHeaders, /) -> LazyHTTPHeaders:
     """
-    Convert ASGI headers to a case-insensitive multi-map.
+    Convert ASGI headers to a case-insensitive multi-map. Nothing is decoded
+    until the headers are actually used.
     """
-    values: list[tuple[LowerStr, str]] = []
-
-    for key, value in headers:
-        lower_str = LowerStr(key.decode("utf-8"))
-        values.append((lower_str, value.decode("utf-8")))
+    if not isinstance(headers, list):
+        headers = list(headers)
 
-    return HTTPHeaders(values)
+    return LazyHTTPHeaders(headers)
 
 
-def headers_to_asgi(headers: HTTPHeaders, /) -> ASGIHeaders:
+def headers_to_asgi(headers: HTTPHeaders, /) -> list[tuple[bytes, bytes]]:
     """
     Convert a case-insensitive multi-map to an ASGI header iterable.
     """
-    asgi_headers: ASGIHeaders = []
+    if isinstance(headers, LazyHTTPHeaders):
+        # These came from an ASGI server in the first place, so there's
+        # nothing to encode.
+        return list(headers.raw)
+
+    if isinstance(headers, FrozenHTTPHeaders):
+        # The caller is free to append to the result, so it can't be shared.
+        return list(headers.encode_asgi())
+
+    asgi_headers: list[tuple[bytes, bytes]] = []
 
-    for key, value in headers:
+    for key, value in headers.as_sequence():
         asgi_headers.append((key.encode("utf-8"), value.encode("utf-8")))
 
     return asgi_headers
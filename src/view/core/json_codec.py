@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = (
+    "AVAILABLE_CODECS",
+    "DEFAULT_CODEC",
+    "JSONCodec",
+    "current_codec",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class JSONCodec:
+    """
+    Pair of functions for converting between Python objects and JSON.
+
+    Both functions work with UTF-8 encoded bytes, so neither side has to go
+    through an intermediate :class:`str`.
+    """
+
+    name: str
+    """
+    Name of the library behind this codec.
+    """
+
+    encode: Callable[[Any], bytes]
+    """
+    Serialize an object to JSON.
+    """
+
+    decode: Callable[[bytes], Any]
+    """
+    Parse JSON into an object. This must raise an exception if the data
+    isn't valid JSON.
+    """
+
+
+def _stdlib_encode(data: Any) -> bytes:
+    return json.dumps(data).encode("utf-8")
+
+
+AVAILABLE_CODECS: dict[str, JSONCodec] = {
+    # json.loads() accepts UTF-8 bytes directly.
+    "json": JSONCodec("json", _stdlib_encode, json.loads),
+}
+"""
+JSON codecs that can be used in this environment, keyed by their name.
+"""
+
+try:
+    import msgspec
+except ImportError:
+    pass
+else:
+    AVAILABLE_CODECS["msgspec"] = JSONCodec(
+        "msgspec", msgspec.json.Encoder().encode, msgspec.json.Decoder().decode
+    )
+
+try:
+    import orjson
+except ImportError:
+    pass
+else:
+
+    def _orjson_encode(data: Any) -> bytes:
+        # The standard library converts non-string keys, so do the same.
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    AVAILABLE_CODECS["orjson"] = JSONCodec(
+        "orjson", _orjson_encode, orjson.loads
+    )
+
+
+DEFAULT_CODEC: JSONCodec = next(
+    AVAILABLE_CODECS[name]
+    for name in ("orjson", "msgspec", "json")
+    if name in AVAILABLE_CODECS
+)
+"""
+The fastest codec that's installed, preferring orjson, then msgspec, and
+falling back to the standard library.
+"""
+
+
+def current_codec() -> JSONCodec:
+    """
+    Get the JSON codec of the app that's currently handling a request, or
+    :data:`DEFAULT_CODEC` outside of a request.
+    """
+    # Avoid circular import issues
+    from view.core.app import BaseApp
+
+    try:
+        return BaseApp.current_app().json_codec
+    except LookupError:
+        return DEFAULT_CODEC
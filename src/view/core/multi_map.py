@@ -6,19 +6,22 @@ from collections.abc import (
     Iterator,
     KeysView,
     Mapping,
+    MutableMapping,
     Sequence,
     ValuesView,
 )
-from typing import Any, TypeVar
+from typing import Any, ClassVar, TypeVar
 
 from view.exceptions import ViewError
 
-__all__ = "HasMultipleValuesError", "MultiMap"
+__all__ = "HasMultipleValuesError", "MultiMap", "MutableMultiMap"
 
 KeyT = TypeVar("KeyT")
 ValueT = TypeVar("ValueT")
 T = TypeVar("T")
 
+_MISSING: Any = object()
+
 
 class HasMultipleValuesError(ViewError):
     """
@@ -29,39 +32,215 @@ class HasMultipleValuesError(ViewError):
         super().__init__(f"{key!r} has multiple values")
 
 
+# The views below are part of the implementation of MultiMap, so they read
+# its private storage directly.
+
+
+class _FirstValuesView(ValuesView[ValueT]):
+    """
+    View of the first value for each key in a :class:`MultiMap`.
+    """
+
+    __slots__ = ()
+    _mapping: MultiMap[Any, ValueT]
+
+    def __iter__(self) -> Iterator[ValueT]:
+        for _, value in self._mapping._first_items():  # noqa: SLF001
+            yield value
+
+
+class _FirstItemsView(ItemsView[KeyT, ValueT]):
+    """
+    View of each key and its first value in a :class:`MultiMap`.
+    """
+
+    __slots__ = ()
+    _mapping: MultiMap[KeyT, ValueT]
+
+    def __iter__(self) -> Iterator[tuple[KeyT, ValueT]]:
+        return self._mapping._first_items()  # noqa: SLF001
+
+
+class _PairsView(Sequence[tuple[KeyT, ValueT]]):
+    """
+    View of every key and value in a :class:`MultiMap`, in insertion order.
+    """
+
+    __slots__ = ("_mapping",)
+
+    def __init__(self, mapping: MultiMap[KeyT, ValueT]) -> None:
+        self._mapping = mapping
+
+    def __len__(self) -> int:
+        return len(self._mapping._keys)  # noqa: SLF001
+
+    def __getitem__(self, index: Any) -> Any:
+        keys = self._mapping._keys  # noqa: SLF001
+        values = self._mapping._values  # noqa: SLF001
+        if isinstance(index, slice):
+            return list(zip(keys[index], values[index]))
+
+        return (keys[index], values[index])
+
+    def __iter__(self) -> Iterator[tuple[KeyT, ValueT]]:
+        mapping = self._mapping
+        return zip(mapping._keys, mapping._values)  # noqa: SLF001
+
+    def __eq__(self, other: object, /) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class MultiMap(Mapping[KeyT, ValueT]):
     """
     Mapping of individual keys to one or many values.
+
+    Entries are stored as parallel key and value tuples, so the original
+    order is kept without copying. Once a map has more than
+    :attr:`COMPACT_SIZE` entries, a dictionary index of each key to all of
+    its values is built alongside them; smaller maps are searched linearly.
+
+    This is immutable; see :class:`MutableMultiMap` for a version that can be
+    built up in place.
+    """
+
+    COMPACT_SIZE: ClassVar[int] = 0
     """
+    Largest number of entries that are looked up with a linear scan instead
+    of a dictionary index.
 
-    __slots__ = ("_values",)
+    A linear scan uses less memory, but isn't faster than the index even
+    for a couple of entries, and a miss is several times slower (see
+    ``benchmarks/multi_map.py``), so only empty maps skip the index by
+    default.
+    """
+
+    __slots__ = ("_index", "_keys", "_unique", "_values")
 
     def __init__(self, items: Iterable[tuple[KeyT, ValueT]] = ()) -> None:
-        self._values: dict[KeyT, list[ValueT]] = {}
+        pairs = items if isinstance(items, (list, tuple)) else list(items)
+        self._keys: Sequence[KeyT]
+        self._values: Sequence[ValueT]
+        if pairs:
+            self._keys, self._values = zip(*pairs)
+        else:
+            self._keys = self._values = ()
+
+        # Index of each key to all of its values, only built for large maps
+        # or when an operation needs the values grouped by key.
+        self._index: dict[KeyT, list[ValueT]] | None = None
+        # Whether no key appears twice, so the keys can be used as-is for
+        # iteration and len() without building the index.
+        self._unique = False
+        if len(self._keys) > self.COMPACT_SIZE:
+            self._build_index()
+        else:
+            self._unique = len(set(self._keys)) == len(self._keys)
+
+    def _build_index(self) -> dict[KeyT, list[ValueT]]:
+        index: dict[KeyT, list[ValueT]] = {}
+        for key, value in zip(self._keys, self._values):
+            values = index.get(key)
+            if values is None:
+                index[key] = [value]
+            else:
+                values.append(value)
+
+        self._index = index
+        return index
+
+    def _grouped(self) -> dict[KeyT, list[ValueT]]:
+        """
+        Get the index of each key to all of its values, building it first
+        if needed.
+        """
+        index = self._index
+        if index is None:
+            return self._build_index()
+
+        return index
+
+    def _normalize_key(self, key: KeyT) -> KeyT:
+        """
+        Convert a key into the form that it's stored as.
+        """
+        return key
+
+    def _first(self, key: Any) -> ValueT | Any:
+        """
+        Get the first value for a key, or ``_MISSING`` if it isn't present.
+        """
+        index = self._index
+        if index is not None:
+            values = index.get(key)
+            return _MISSING if values is None else values[0]
+
+        keys = self._keys
+        if not keys:
+            return _MISSING
+
+        try:
+            return self._values[keys.index(key)]
+        except ValueError:
+            return _MISSING
+
+    def _lookup(self, key: Any) -> Sequence[ValueT] | None:
+        """
+        Get all the values for a key, or ``None`` if it isn't present.
+        """
+        index = self._index
+        if index is not None:
+            return index.get(key)
+
+        keys = self._keys
+        if key not in keys:
+            return None
+
+        return [
+            value for other, value in zip(keys, self._values) if other == key
+        ]
+
+    def _first_items(self) -> Iterator[tuple[KeyT, ValueT]]:
+        if self._index is None and self._unique:
+            return zip(self._keys, self._values)
 
-        for key, value in items:
-            values = self._values.setdefault(key, [])
-            values.append(value)
+        return ((key, values[0]) for key, values in self._grouped().items())
 
     def __getitem__(self, key: KeyT, /) -> ValueT:
         """
         Get the first value if it exists, or else raise a :exc:`KeyError`.
         """
+        value = self._first(key)
+        if value is _MISSING:
+            raise KeyError(key)
 
-        return self._values[key][0]
+        return value
 
     def __len__(self) -> int:
-        return len(self._values)
+        if self._index is None and self._unique:
+            return len(self._keys)
+
+        return len(self._grouped())
 
     def __iter__(self) -> Iterator[KeyT]:
-        return iter(self._values)
+        if self._index is None and self._unique:
+            return iter(self._keys)
+
+        return iter(self._grouped())
 
     def __contains__(self, key: object, /) -> bool:
-        return key in self._values
+        return self._first(key) is not _MISSING
 
     def __eq__(self, other: object, /) -> bool:
         if isinstance(other, MultiMap):
-            return other._values == self._values
+            return other._grouped() == self._grouped()
 
         if isinstance(other, dict):
             return self._as_flat() == other
@@ -70,87 +249,155 @@ class MultiMap(Mapping[KeyT, ValueT]):
 
     def __ne__(self, other: object, /) -> bool:
         if isinstance(other, MultiMap):
-            return other._values != self._values
+            return other._grouped() != self._grouped()
 
         return NotImplemented
 
     def __repr__(self) -> str:
-        return f"MultiMap({self.as_sequence()})"
+        return f"{type(self).__name__}({list(self.as_sequence())})"
 
     def __hash__(self) -> int:
-        return hash(self._values)
+        return hash(tuple(self.as_sequence()))
 
     def _as_flat(self) -> dict[KeyT, ValueT]:
         """
         Turn this into a "flat" representation of the mapping in which all
         keys have exactly one value.
         """
-        return {key: value[0] for key, value in self._values.items()}
+        return dict(self._first_items())
 
     def keys(self) -> KeysView[KeyT]:
         """
         Return a view of all the keys in this map.
         """
-        return self._values.keys()
+        return KeysView(self)
 
     def values(self) -> ValuesView[ValueT]:
         """
         Return a view of the first value for each key in the mapping.
         """
-        return self._as_flat().values()
+        return _FirstValuesView(self)
 
     def many_values(self) -> ValuesView[Sequence[ValueT]]:
         """
         Return a view of all values in the mapping.
         """
-        return self._values.values()
+        return self._grouped().values()
 
     def items(self) -> ItemsView[KeyT, ValueT]:
         """
         Return a view of all items in the mapping, using the first value
         for each key.
         """
-        return self._as_flat().items()
+        return _FirstItemsView(self)
 
     def many_items(self) -> ItemsView[KeyT, Sequence[ValueT]]:
         """
         Return a view of all items in the mapping.
         """
-        return self._values.items()
+        return self._grouped().items()
 
     def get_many(self, key: KeyT) -> Sequence[ValueT]:
         """
         Get one or many values for a given key.
         """
-        return self._values[key]
+        values = self._lookup(key)
+        if values is None:
+            raise KeyError(key)
+
+        return values
 
     def get_exactly_one(self, key: KeyT) -> ValueT:
         """
         Get precisely one value for a key. If more than one value is present,
         then this raises a :exc:`HasMultipleValuesError`.
         """
-        value = self._values[key]
-        if len(value) != 1:
+        values = self.get_many(key)
+        if len(values) != 1:
             raise HasMultipleValuesError(key)
 
-        return value[0]
+        return values[0]
 
     def as_sequence(self) -> Sequence[tuple[KeyT, ValueT]]:
         """
-        Return all the keys and values in a sequence of (key, value) tuples.
-        """
-        result: list[tuple[KeyT, ValueT]] = []
-        for key, values in self._values.items():
-            for value in values:
-                result.append((key, value))  # noqa: PERF401
+        Return all the keys and values in a sequence of (key, value) tuples,
+        in the order that they were added.
 
-        return result
+        This is a view and doesn't make a copy.
+        """
+        return _PairsView(self)
 
     def with_new_value(
         self, key: KeyT, value: ValueT
     ) -> MultiMap[KeyT, ValueT]:
         """
         Create a copy of this map with a new key and value included.
+
+        This has to copy the entire map; prefer :meth:`MutableMultiMap.add`
+        when building a map up.
         """
-        new_sequence = [*list(self.as_sequence()), (key, value)]
+        new_sequence = [*self.as_sequence(), (key, value)]
         return type(self)(new_sequence)
+
+
+class MutableMultiMap(MultiMap[KeyT, ValueT], MutableMapping[KeyT, ValueT]):
+    """
+    Multi-map that can be modified in place.
+
+    Assigning to a key replaces all of its values, while :meth:`add` appends
+    another value for it.
+    """
+
+    __slots__ = ()
+    __hash__ = None  # type: ignore[assignment]
+
+    _keys: list[KeyT]
+    _values: list[ValueT]
+
+    def __init__(self, items: Iterable[tuple[KeyT, ValueT]] = ()) -> None:
+        super().__init__(items)
+        self._keys = list(self._keys)
+        self._values = list(self._values)
+
+    def add(self, key: KeyT, value: ValueT) -> None:
+        """
+        Add another value for a key, without removing any existing ones.
+        """
+        key = self._normalize_key(key)
+        index = self._index
+        if index is not None:
+            values = index.get(key)
+            if values is None:
+                index[key] = [value]
+            else:
+                values.append(value)
+        elif self._unique and key in self._keys:
+            self._unique = False
+
+        self._keys.append(key)
+        self._values.append(value)
+        if index is None and len(self._keys) > self.COMPACT_SIZE:
+            self._build_index()
+
+    def _remove(self, key: KeyT) -> None:
+        keep = [other != key for other in self._keys]
+        self._keys = [other for other, kept in zip(self._keys, keep) if kept]
+        self._values = [
+            value for value, kept in zip(self._values, keep) if kept
+        ]
+        if self._index is not None:
+            del self._index[key]
+
+    def __setitem__(self, key: KeyT, value: ValueT, /) -> None:
+        key = self._normalize_key(key)
+        if key in self._keys:
+            self._remove(key)
+
+        self.add(key, value)
+
+    def __delitem__(self, key: KeyT, /) -> None:
+        key = self._normalize_key(key)
+        if key not in self._keys:
+            raise KeyError(key)
+
+        self._remove(key)
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import asyncio
+import urllib.parse
+from dataclasses import dataclass, field
+from tempfile import SpooledTemporaryFile
+from typing import TYPE_CHECKING
+
+from view.core.body import BodyAlreadyUsedError
+from view.core.headers import CONTENT_DISPOSITION, CONTENT_TYPE, HTTPHeaders
+from view.core.status_codes import ContentTooLarge
+from view.exceptions import ViewError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+__all__ = (
+    "InvalidMultipartError",
+    "MultipartPart",
+    "MultipartSettings",
+    "parse_multipart",
+)
+
+
+class InvalidMultipartError(ViewError):
+    """
+    The body is not valid ``multipart/form-data``.
+
+    If this occurred when parsing the body for a request, the fix is
+    usually to reraise this with an error 400 (Bad Request).
+    """
+
+
+@dataclass(slots=True, frozen=True)
+class MultipartSettings:
+    """
+    Limits for parsing a ``multipart/form-data`` body.
+    """
+
+    max_part_size: int | None = None
+    """
+    Maximum size of a single part's data in bytes, or ``None`` for no
+    limit. Larger parts are rejected with :class:`ContentTooLarge`.
+    """
+
+    max_parts: int = 1000
+    """
+    Maximum number of parts in the body.
+    """
+
+    max_header_size: int = 16 * 1024
+    """
+    Maximum size of a single part's headers in bytes.
+    """
+
+    spool_size: int = 1024 * 1024
+    """
+    Parts larger than this (in bytes) are written to a temporary file on
+    disk by :meth:`MultipartPart.spool`, instead of being kept in memory.
+    """
+
+
+def parse_header_options(value: str, /) -> tuple[str, dict[str, str]]:
+    """
+    Split a header value such as ``form-data; name="file"`` into its main
+    value and a dictionary of its (lowercased) option names and values.
+    """
+    main, _, rest = value.partition(";")
+    options: dict[str, str] = {}
+    while rest:
+        name, _, rest = rest.partition("=")
+        name = name.strip().lower()
+        rest = rest.lstrip()
+        if rest.startswith('"'):
+            # Quoted string, possibly with backslash escapes
+            characters: list[str] = []
+            index = 1
+            while index < len(rest) and rest[index] != '"':
+                if rest[index] == "\\" and index + 1 < len(rest):
+                    index += 1
+                characters.append(rest[index])
+                index += 1
+
+            option = "".join(characters)
+            _, _, rest = rest[index + 1 :].partition(";")
+        else:
+            option, _, rest = rest.partition(";")
+            option = option.strip()
+
+        if name:
+            options[name] = option
+
+    return main.strip().lower(), options
+
+
+def _extended_filename(value: str) -> str | None:
+    # RFC 5987 encoding, as in filename*=UTF-8''na%C3%AFve.txt
+    charset, _, rest = value.partition("'")
+    _, _, encoded = rest.partition("'")
+    try:
+        return urllib.parse.unquote(encoded, charset or "utf-8", "strict")
+    except (LookupError, UnicodeDecodeError):
+        return None
+
+
+@dataclass(slots=True)
+class MultipartPart:
+    """
+    A single part of a ``multipart/form-data`` body.
+
+    The data of a part can only be read while it's the current part; once
+    the next part is requested, anything that wasn't read is skipped.
+    """
+
+    headers: HTTPHeaders
+    """
+    The headers of this part.
+    """
+
+    name: str | None
+    """
+    The form field name, from the ``Content-Disposition`` header.
+    """
+
+    filename: str | None
+    """
+    The name of the uploaded file, from the ``Content-Disposition`` header,
+    or ``None`` if this part isn't a file.
+    """
+
+    _data: AsyncIterator[bytes] = field(repr=False)
+    _spool_size: int = field(repr=False)
+    _consumed: bool = field(default=False, repr=False)
+
+    @property
+    def content_type(self) -> str:
+        """
+        The media type of this part, which defaults to ``text/plain``.
+        """
+        return self.headers.get(CONTENT_TYPE, "text/plain")
+
+    def stream(self) -> AsyncIterator[bytes]:
+        """
+        Incrementally stream the data of this part.
+        """
+        if self._consumed:
+            raise BodyAlreadyUsedError
+
+        self._consumed = True
+        return self._data
+
+    async def read(self) -> bytes:
+        """
+        Read all the data of this part into memory.
+        """
+        chunks = [data async for data in self.stream()]
+        if len(chunks) == 1:
+            return chunks[0]
+
+        return b"".join(chunks)
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        """
+        Read all the data of this part as a string.
+        """
+        return (await self.read()).decode(encoding)
+
+    async def spool(self) -> SpooledTemporaryFile[bytes]:
+        """
+        Write the data of this part to a temporary file, which is kept in
+        memory until it grows past
+        :attr:`MultipartSettings.spool_size`. The file is rewound to the
+        start before it's returned.
+        """
+        file = SpooledTemporaryFile[bytes](max_size=self._spool_size)
+        written = 0
+        async for data in self.stream():
+            written += len(data)
+            if written > self._spool_size:
+                # The file is on disk now, so writing to it can block.
+                await asyncio.to_thread(file.write, data)
+            else:
+                file.write(data)
+
+        file.seek(0)
+        return file
+
+
+def _take(buffer: bytearray, size: int) -> bytes:
+    # Copy through a memoryview, since slicing the bytearray first would
+    # copy the data twice.
+    with memoryview(buffer) as view:
+        data = view[:size].tobytes()
+
+    del buffer[:size]
+    return data
+
+
+class _MultipartReader:
+    """
+    Incremental parser over a stream of body chunks.
+    """
+
+    __slots__ = ("_buffer", "_chunks", "_delimiter", "_finished", "settings")
+
+    def __init__(
+        self,
+        chunks: AsyncIterator[bytes],
+        boundary: bytes,
+        settings: MultipartSettings,
+    ) -> None:
+        self._chunks = chunks
+        self._delimiter = b"\r\n--" + boundary
+        # Pretend the body starts with a line break, so the first boundary
+        # is found the same way as every other one.
+        self._buffer = bytearray(b"\r\n")
+        self._finished = False
+        self.settings = settings
+
+    async def _fill(self) -> bool:
+        async for data in self._chunks:
+            if data:
+                self._buffer += data
+                return True
+
+        return False
+
+    async def _require(self, size: int) -> None:
+        while len(self._buffer) < size:
+            if not await self._fill():
+                raise InvalidMultipartError(
+                    "Body ended before the closing boundary"
+                )
+
+    async def _after_delimiter(self) -> None:
+        await self._require(2)
+        buffer = self._buffer
+        if buffer[:2] == b"--":
+            self._finished = True
+            return
+
+        # Anything between the boundary and the line break is padding.
+        index = buffer.find(b"\r\n")
+        while index == -1:
+            if len(buffer) > self.settings.max_header_size:
+                raise InvalidMultipartError("Boundary line is too long")
+            await self._require(len(buffer) + 1)
+            index = buffer.find(b"\r\n")
+
+        if buffer[:index].strip(b" \t"):
+            raise InvalidMultipartError("Unexpected data after boundary")
+
+        del buffer[: index + 2]
+
+    async def _read_data(self, limit: int | None) -> AsyncIterator[bytes]:
+        delimiter = self._delimiter
+        keep = len(delimiter) - 1
+        buffer = self._buffer
+        size = 0
+        start = 0
+
+        while True:
+            index = buffer.find(delimiter, start)
+            if index != -1:
+                data = _take(buffer, index)
+                del buffer[: len(delimiter)]
+                size += len(data)
+                if limit is not None and size > limit:
+                    raise ContentTooLarge
+                if data:
+                    yield data
+
+                await self._after_delimiter()
+                return
+
+            # The end of the buffer might be the start of a delimiter, so
+            # it has to be held back until more data arrives.
+            if len(buffer) > keep:
+                data = _take(buffer, len(buffer) - keep)
+                size += len(data)
+                if limit is not None and size > limit:
+                    raise ContentTooLarge
+                yield data
+
+            start = max(len(buffer) - keep, 0)
+            if not await self._fill():
+                raise InvalidMultipartError(
+                    "Body ended before the closing boundary"
+                )
+
+    async def _read_headers(self) -> HTTPHeaders:
+        await self._require(2)
+        buffer = self._buffer
+        if buffer[:2] == b"\r\n":
+            del buffer[:2]
+            return HTTPHeaders()
+
+        index = buffer.find(b"\r\n\r\n")
+        while index == -1:
+            if len(buffer) > self.settings.max_header_size:
+                raise InvalidMultipartError("Part headers are too large")
+            await self._require(len(buffer) + 1)
+            index = buffer.find(b"\r\n\r\n")
+
+        if index > self.settings.max_header_size:
+            raise InvalidMultipartError("Part headers are too large")
+
+        items: list[tuple[str, str]] = []
+        for line in bytes(buffer[:index]).split(b"\r\n"):
+            name, colon, value = line.partition(b":")
+            if not colon:
+                raise InvalidMultipartError(f"Invalid part header: {line!r}")
+
+            try:
+                items.append(
+                    (name.strip().decode("ascii"), value.strip().decode())
+                )
+            except UnicodeDecodeError as error:
+                raise InvalidMultipartError(
+                    "Part headers are not valid UTF-8"
+                ) from error
+
+        del buffer[: index + 4]
+        return HTTPHeaders(items)
+
+    async def parts(self) -> AsyncIterator[MultipartPart]:
+        settings = self.settings
+        async for _ in self._read_data(None):
+            # Discard the preamble
+            pass
+
+        count = 0
+        while not self._finished:
+            count += 1
+            if count > settings.max_parts:
+                raise ContentTooLarge
+
+            headers = await self._read_headers()
+            _, options = parse_header_options(
+                headers.get(CONTENT_DISPOSITION, "")
+            )
+            filename = options.get("filename")
+            extended = options.get("filename*")
+            if extended is not None:
+                filename = _extended_filename(extended) or filename
+
+            part = MultipartPart(
+                headers,
+                options.get("name"),
+                filename,
+                self._read_data(settings.max_part_size),
+                settings.spool_size,
+            )
+            yield part
+
+            # Skip whatever the caller didn't read. Parts are created only
+            # here, so the reader owns their private state.
+            async for _ in part._data:  # noqa: SLF001
+                pass
+            part._consumed = True  # noqa: SLF001
+
+
+def parse_multipart(
+    chunks: AsyncIterator[bytes],
+    boundary: str | bytes,
+    /,
+    settings: MultipartSettings | None = None,
+) -> AsyncIterator[MultipartPart]:
+    """
+    Incrementally parse a ``multipart/form-data`` body from a stream of
+    chunks, yielding each part as soon as its headers have been read.
+    """
+    if isinstance(boundary, str):
+        try:
+            boundary = boundary.encode("ascii")
+        except UnicodeEncodeError as error:
+            raise InvalidMultipartError(
+                f"Invalid boundary: {boundary!r}"
+            ) from error
+
+    # RFC 2046 limits boundaries to 70 characters
+    if not 0 < len(boundary) <= 70:  # noqa: PLR2004
+        raise InvalidMultipartError(f"Invalid boundary: {boundary!r}")
+
+    reader = _MultipartReader(
+        chunks, boundary, settings or MultipartSettings()
+    )
+    return reader.parts()
@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import inspect
+import types
+import typing
+from collections.abc import Callable, Collection, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeAlias, Union
+
+from view.core.status_codes import BadRequest
+from view.exceptions import ViewError
+
+if TYPE_CHECKING:
+    from view.core.multi_map import MultiMap
+    from view.core.request import Request
+
+__all__ = (
+    "ArgumentBinder",
+    "Header",
+    "Query",
+    "UnresolvableParameterError",
+    "compile_binder",
+)
+
+ArgumentBinder: TypeAlias = Callable[["Request"], dict[str, Any]]
+_Getter: TypeAlias = Callable[["Request"], Any]
+
+
+class UnresolvableParameterError(ViewError):
+    """
+    A view has a parameter that view.py doesn't know how to fill in.
+
+    Every required parameter of a route view has to be the
+    :class:`Request`, a path parameter, the validated body model of the
+    route, or be annotated with :class:`Query` or :class:`Header`.
+    Parameters with a default value that are none of those are left alone.
+    """
+
+
+@dataclass(slots=True, frozen=True)
+class Query:
+    """
+    Marker for a view parameter that comes from the query string, used with
+    :data:`typing.Annotated`::
+
+        @app.get("/search")
+        async def search(page: Annotated[int, Query()] = 1): ...
+    """
+
+    name: str | None = None
+    """
+    Name of the query parameter, which defaults to the name of the view
+    parameter.
+    """
+
+
+@dataclass(slots=True, frozen=True)
+class Header:
+    """
+    Marker for a view parameter that comes from a request header, used with
+    :data:`typing.Annotated`.
+    """
+
+    name: str | None = None
+    """
+    Name of the header, which defaults to the name of the view parameter
+    with underscores replaced by dashes.
+    """
+
+
+_CONVERTERS: dict[object, Callable[[str], Any]] = {
+    str: str,
+    int: int,
+    float: float,
+}
+
+
+def _is_union(hint: object) -> bool:
+    origin = typing.get_origin(hint)
+    return origin is Union or (
+        hasattr(types, "UnionType") and origin is types.UnionType
+    )
+
+
+def _unwrap_optional(hint: Any) -> Any:
+    if _is_union(hint):
+        arguments = typing.get_args(hint)
+        options = [
+            argument for argument in arguments if argument is not type(None)
+        ]
+        if len(options) == 1:
+            return options[0]
+
+    return hint
+
+
+def _converter(hint: Any, name: str) -> Callable[[str], Any]:
+    converter = _CONVERTERS.get(hint)
+    if converter is None:
+        raise UnresolvableParameterError(
+            f"Parameter {name!r} has type {hint!r}, which can't be"
+            " converted from a string"
+        )
+
+    return converter
+
+
+_MISSING: Any = object()
+
+
+def _multi_map_getter(
+    source: Callable[[Request], MultiMap[str, str]],
+    key: str,
+    description: str,
+    hint: Any,
+    default: Any,
+    name: str,
+) -> _Getter:
+    hint = _unwrap_optional(hint)
+    if typing.get_origin(hint) in {list, Sequence}:
+        arguments = typing.get_args(hint)
+        convert_item = _converter(arguments[0] if arguments else str, name)
+
+        def get_many(request: Request) -> Any:
+            try:
+                values = source(request).get_many(key)
+            except KeyError:
+                if default is _MISSING:
+                    raise BadRequest(f"Missing {description}") from None
+
+                return default
+
+            try:
+                return [convert_item(value) for value in values]
+            except ValueError as error:
+                raise BadRequest(f"Invalid {description}") from error
+
+        return get_many
+
+    convert = _converter(hint, name)
+
+    def get(request: Request) -> Any:
+        value = source(request).get(key, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise BadRequest(f"Missing {description}")
+
+            return default
+
+        try:
+            return convert(value)
+        except ValueError as error:
+            raise BadRequest(f"Invalid {description}") from error
+
+    return get
+
+
+def _path_parameter_getter(key: str, hint: Any) -> _Getter:
+    convert = _converter(_unwrap_optional(hint), key)
+    if convert is str:
+
+        def get_string(request: Request) -> Any:
+            return request.path_parameters[key]
+
+        return get_string
+
+    def get(request: Request) -> Any:
+        try:
+            return convert(request.path_parameters[key])
+        except ValueError as error:
+            raise BadRequest(f"Invalid path parameter {key!r}") from error
+
+    return get
+
+
+def _get_request(request: Request) -> Request:
+    return request
+
+
+def _get_validated_body(request: Request) -> Any:
+    return request.validated_body
+
+
+def _get_query_parameters(request: Request) -> MultiMap[str, str]:
+    return request.query_parameters
+
+
+def _get_headers(request: Request) -> MultiMap[str, str]:
+    return request.headers
+
+
+def _unresolvable_annotation(
+    view: Callable[..., Any],
+    parameters: list[inspect.Parameter],
+    error: NameError,
+) -> UnresolvableParameterError:
+    # NameError.name was only added in Python 3.10.
+    missing: str | None = getattr(error, "name", None)
+    for parameter in parameters:
+        annotation = parameter.annotation
+        if missing and isinstance(annotation, str) and missing in annotation:
+            return UnresolvableParameterError(
+                f"Annotation of parameter {parameter.name!r} of {view!r}"
+                f" can't be resolved: {error}"
+            )
+
+    return UnresolvableParameterError(
+        f"Annotations of {view!r} can't be resolved: {error}"
+    )
+
+
+def compile_binder(
+    view: Callable[..., Any],
+    path_parameters: Collection[str],
+    *,
+    body: Any = None,
+) -> ArgumentBinder | None:
+    """
+    Inspect the signature of a view once, and build a function that
+    collects the keyword arguments for it from a request. If there's
+    nothing to pass to the view, this returns ``None``.
+
+    Values from the path, query string, or headers are converted to
+    ``str``, ``int``, or ``float`` according to their annotation, and query
+    strings and headers may also be annotated as a ``list`` of those to get
+    every value. Missing or malformed values are rejected with
+    :class:`~view.core.status_codes.BadRequest`, unless the parameter has a
+    default value. Any other parameter with a default value keeps it.
+    """
+    # Avoid circular import issues
+    from view.core.request import Request
+
+    # Variadic parameters, as used by decorators that forward everything,
+    # don't need anything passed to them.
+    parameters = [
+        parameter
+        for parameter in inspect.signature(view).parameters.values()
+        if parameter.kind
+        not in {
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        }
+    ]
+    if not parameters:
+        return None
+
+    # inspect.signature() looks through decorators, so the annotations have
+    # to come from the same place.
+    try:
+        hints = typing.get_type_hints(
+            inspect.unwrap(view), include_extras=True
+        )
+    except NameError as error:
+        raise _unresolvable_annotation(view, parameters, error) from error
+
+    getters: list[tuple[str, _Getter]] = []
+    for parameter in parameters:
+        name = parameter.name
+        if parameter.kind is inspect.Parameter.POSITIONAL_ONLY:
+            if parameter.default is not parameter.empty:
+                continue
+
+            raise UnresolvableParameterError(
+                f"Parameter {name!r} of {view!r} must be able to be passed"
+                " by keyword"
+            )
+
+        hint = hints.get(name, str)
+        marker: Query | Header | None = None
+        if typing.get_origin(hint) is typing.Annotated:
+            hint, *metadata = typing.get_args(hint)
+            for item in metadata:
+                if isinstance(item, (Query, Header)):
+                    marker = item
+
+        default = (
+            _MISSING
+            if parameter.default is parameter.empty
+            else parameter.default
+        )
+        if isinstance(marker, Query):
+            key = marker.name or name
+            getter = _multi_map_getter(
+                _get_query_parameters,
+                key,
+                f"query parameter {key!r}",
+                hint,
+                default,
+                name,
+            )
+        elif isinstance(marker, Header):
+            key = marker.name or name.replace("_", "-")
+            getter = _multi_map_getter(
+                _get_headers, key, f"header {key!r}", hint, default, name
+            )
+        elif isinstance(hint, type) and issubclass(hint, Request):
+            getter = _get_request
+        elif name in path_parameters:
+            getter = _path_parameter_getter(name, hint)
+        elif body is not None and hint == body:
+            getter = _get_validated_body
+        elif default is not _MISSING:
+            # Nothing is passed, so the view gets its own default.
+            continue
+        else:
+            raise UnresolvableParameterError(
+                f"Don't know what to pass to parameter {name!r} of {view!r}"
+            )
+
+        getters.append((name, getter))
+
+    if not getters:
+        return None
+
+    def bind(request: Request) -> dict[str, Any]:
+        return {name: getter(request) for name, getter in getters}
+
+    return bind
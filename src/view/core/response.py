@@ -1,27 +1,58 @@
 from __future__ import annotations
 
-import json
+import functools
 import mimetypes
 import sys
 import warnings
-from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
-from dataclasses import dataclass
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+)
+from dataclasses import dataclass, field
 from os import PathLike
-from typing import Any, AnyStr, Generic, TypeAlias
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AnyStr,
+    ClassVar,
+    Generic,
+    ParamSpec,
+    TypeAlias,
+)
 
 import aiofiles
 from loguru import logger
 
-from view.core.body import BodyMixin
+from view.core.body import BodyMixin, BodyStream
 from view.core.headers import (
+    CONTENT_LENGTH,
+    CONTENT_TYPE,
+    FrozenHTTPHeaders,
     HeadersLike,
     HTTPHeaders,
-    LowerStr,
+    MutableHTTPHeaders,
     as_real_headers,
 )
+from view.core.json_codec import JSONCodec, current_codec
 from view.exceptions import InvalidTypeError, ViewError
 
-__all__ = "Response", "ResponseLike", "ViewResult"
+if TYPE_CHECKING:
+    from view.core.status_codes import HTTPError
+
+__all__ = (
+    "JSONStreamResponse",
+    "PrebuiltResponse",
+    "Response",
+    "ResponseLike",
+    "ViewResult",
+    "static_response",
+)
+
+P = ParamSpec("P")
 
 
 @dataclass(slots=True)
@@ -32,6 +63,19 @@ class Response(BodyMixin):
 
     status_code: int
     headers: HTTPHeaders
+    content_length: int | None = field(default=None, kw_only=True)
+    """
+    The size of the body in bytes, if it's known before the body is read.
+    Servers use this to send a ``Content-Length`` header.
+    """
+
+    long_lived: ClassVar[bool] = False
+    """
+    Whether this response streams for as long as the client is connected,
+    like an event stream. Servers send each chunk of a long-lived response
+    as soon as it's produced, and stop producing it once the client
+    disconnects.
+    """
 
     def __post_init__(self) -> None:
         if __debug__:
@@ -74,6 +118,21 @@ def _guess_file_type(path: StrPath, /) -> str:
     return mimetypes.guess_type(path)[0] or "text/plain"
 
 
+def _with_content_type(
+    headers: HeadersLike | None, content_type: str
+) -> HTTPHeaders:
+    multi_map = as_real_headers(headers)
+    if CONTENT_TYPE in multi_map:
+        return multi_map
+
+    if multi_map is headers or not isinstance(multi_map, MutableHTTPHeaders):
+        # Don't modify headers that belong to the caller
+        multi_map = MutableHTTPHeaders(multi_map.as_sequence())
+
+    multi_map.add(CONTENT_TYPE, content_type)
+    return multi_map
+
+
 @dataclass(slots=True)
 class FileResponse(Response):
     """
@@ -107,13 +166,9 @@ class FileResponse(Response):
                     length = len(data)
                     yield data
 
-        multi_map = as_real_headers(headers)
-        if "content-type" not in multi_map:
-            content_type = content_type or _guess_file_type(path)
-            multi_map = multi_map.with_new_value(
-                LowerStr("content-type"), content_type
-            )
-
+        multi_map = _with_content_type(
+            headers, content_type or _guess_file_type(path)
+        )
         return cls(stream, status_code, multi_map, path)
 
 
@@ -152,37 +207,136 @@ class TextResponse(Response, Generic[AnyStr]):
         if __debug__ and not isinstance(content, (str, bytes)):
             raise InvalidTypeError(content, str, bytes)
 
+        data = _as_bytes(content)
+
         async def stream() -> AsyncGenerator[bytes]:
-            yield _as_bytes(content)
+            yield data
 
-        return cls(stream, status_code, as_real_headers(headers), content)
+        return cls(
+            stream,
+            status_code,
+            as_real_headers(headers),
+            content,
+            content_length=len(data),
+        )
 
 
 @dataclass(slots=True)
 class JSONResponse(Response):
     content: dict[str, Any]
-    parsed_data: str
+    parsed_data: bytes
 
     @classmethod
     def from_content(
         cls,
         content: dict[str, Any],
         *,
-        parse_function: Callable[[dict[str, Any]], str] = json.dumps,
+        parse_function: Callable[[dict[str, Any]], str] | None = None,
+        codec: JSONCodec | None = None,
         status_code: int = 200,
         headers: HeadersLike | None = None,
     ) -> JSONResponse:
-        data = parse_function(content)
+        """
+        Serialize ``content`` into a response.
+
+        This uses ``codec``, or else the current app's
+        :attr:`~view.core.app.BaseApp.json_codec`, which encodes straight to
+        bytes. A ``parse_function`` that returns a string can be given
+        instead.
+        """
+        if parse_function is not None:
+            encoded = parse_function(content).encode("utf-8")
+        else:
+            encoded = (codec or current_codec()).encode(content)
 
         async def stream() -> AsyncGenerator[bytes]:
-            yield data.encode("utf-8")
+            yield encoded
 
         return cls(
             content=content,
-            parsed_data=data,
+            parsed_data=encoded,
             headers=as_real_headers(headers),
             status_code=status_code,
             receive_data=stream,
+            content_length=len(encoded),
+        )
+
+
+@dataclass(slots=True)
+class JSONStreamResponse(Response):
+    """
+    Response that serializes items one at a time as they're streamed, as
+    either a JSON array or newline-delimited JSON (NDJSON).
+
+    Only a batch of encoded items is held in memory at once, instead of
+    the whole document.
+    """
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[Any] | AsyncIterable[Any],
+        /,
+        *,
+        ndjson: bool = False,
+        codec: JSONCodec | None = None,
+        chunk_size: int = 64 * 1024,
+        status_code: int = 200,
+        headers: HeadersLike | None = None,
+    ) -> JSONStreamResponse:
+        """
+        Generate a :class:`JSONStreamResponse` from a synchronous or
+        asynchronous iterable.
+
+        Encoded items are gathered until there's at least ``chunk_size``
+        bytes of them, and then sent as one chunk.
+        """
+        encode = (codec or current_codec()).encode
+
+        async def stream() -> AsyncGenerator[bytes]:
+            pending: list[bytes] = [] if ndjson else [b"["]
+            size = 0
+            first = True
+
+            def add(item: Any) -> bool:
+                nonlocal size, first
+                encoded = encode(item)
+                if ndjson:
+                    pending.append(encoded)
+                    pending.append(b"\n")
+                else:
+                    if not first:
+                        pending.append(b",")
+                    pending.append(encoded)
+
+                first = False
+                size += len(encoded) + 1
+                return size >= chunk_size
+
+            def flush() -> bytes:
+                nonlocal size
+                data = b"".join(pending)
+                pending.clear()
+                size = 0
+                return data
+
+            if isinstance(items, AsyncIterable):
+                async for item in items:
+                    if add(item):
+                        yield flush()
+            else:
+                for item in items:
+                    if add(item):
+                        yield flush()
+
+            if not ndjson:
+                pending.append(b"]")
+
+            yield b"".join(pending)
+
+        media_type = "application/x-ndjson" if ndjson else "application/json"
+        return cls(
+            stream, status_code, _with_content_type(headers, media_type)
         )
 
 
@@ -235,7 +389,8 @@ def _wrap_response(response: ResponseLike, /) -> Response:
     """
     Wrap a response from a view into a :class:`Response` object.
     """
-    logger.debug(f"Got response: {response!r}")
+    if __debug__:
+        logger.debug(f"Got response: {response!r}")
     if isinstance(response, Response):
         return response
 
@@ -273,3 +428,106 @@ async def wrap_view_result(result: ViewResult, /) -> Response:
         result = await result
 
     return _wrap_response(result)
+
+
+@dataclass(slots=True, frozen=True)
+class PrebuiltResponse:
+    """
+    A response that's rendered once and then served many times.
+
+    Every call to :meth:`response` creates a new :class:`TextResponse`,
+    since bodies can only be read once, but the body, the stream function,
+    and the headers (along with their cached ASGI encoding) are shared.
+    """
+
+    body: bytes
+    status_code: int
+    headers: FrozenHTTPHeaders
+    stream: BodyStream
+
+    @classmethod
+    def from_body(
+        cls, body: bytes, status_code: int, headers: FrozenHTTPHeaders
+    ) -> PrebuiltResponse:
+        """
+        Prebuild a response from an already encoded body.
+        """
+
+        async def stream() -> AsyncGenerator[bytes]:
+            yield body
+
+        return cls(body, status_code, headers, stream)
+
+    @classmethod
+    async def from_response(cls, response: Response) -> PrebuiltResponse:
+        """
+        Prebuild a response by reading another one into memory. A
+        ``Content-Length`` header is added if it's missing.
+        """
+        body = await response.body()
+        items = list(response.headers.as_sequence())
+        if CONTENT_LENGTH not in response.headers:
+            # Including the length lets the whole header list be encoded
+            # once, instead of the server appending it every time.
+            items.append((CONTENT_LENGTH, str(len(body))))
+
+        return cls.from_body(
+            body, response.status_code, FrozenHTTPHeaders(items)
+        )
+
+    def response(self) -> TextResponse[bytes]:
+        """
+        Create a new response object that shares the prebuilt data.
+        """
+        return TextResponse(
+            self.stream,
+            self.status_code,
+            self.headers,
+            self.body,
+            content_length=len(self.body),
+        )
+
+
+def static_response(
+    view: Callable[P, ViewResult], /
+) -> Callable[P, Awaitable[Response | HTTPError | type[HTTPError]]]:
+    """
+    Decorator for a view that always returns the same response, such as a
+    health check or ``robots.txt``.
+
+    The view is only called until it returns a response, normally on the
+    first request. That response is read into memory along with headers
+    that include ``Content-Length``, and every later request is served a
+    fresh response object that shares that body and those (already
+    encoded) headers. Returned HTTP errors are passed on to the app as-is
+    and aren't cached.
+    """
+    if __debug__ and not callable(view):
+        raise InvalidTypeError(view, Callable)
+
+    # Avoid circular import issues
+    from view.core.status_codes import HTTPError
+
+    prebuilt: PrebuiltResponse | None = None
+
+    @functools.wraps(view)
+    async def wrapper(
+        *args: P.args, **kwargs: P.kwargs
+    ) -> Response | HTTPError | type[HTTPError]:
+        nonlocal prebuilt
+        if prebuilt is None:
+            result: Any = view(*args, **kwargs)
+            if isinstance(result, Awaitable):
+                result = await result
+
+            if isinstance(result, HTTPError) or (
+                isinstance(result, type) and issubclass(result, HTTPError)
+            ):
+                return result
+
+            response = _wrap_response(result)
+            prebuilt = await PrebuiltResponse.from_response(response)
+
+        return prebuilt.response()
+
+    return wrapper
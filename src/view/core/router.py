@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from collections.abc import Awaitable, Callable, MutableMapping
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, TypeAlias
+from typing import TYPE_CHECKING, Any, TypeAlias
 
+from view.core.parameters import ArgumentBinder, compile_binder
 from view.core.status_codes import HTTPError, status_exception
+from view.core.validation import Validator, compile_validator
 from view.exceptions import InvalidTypeError, ViewError
 
 if TYPE_CHECKING:
@@ -14,7 +16,7 @@ if TYPE_CHECKING:
 __all__ = "Route", "Router"
 
 
-RouteView: TypeAlias = Callable[[], "ResponseLike | Awaitable[ResponseLike]"]
+RouteView: TypeAlias = Callable[..., "ResponseLike | Awaitable[ResponseLike]"]
 
 
 @dataclass(slots=True, frozen=True)
@@ -26,6 +28,21 @@ class Route:
     view: RouteView
     path: str
     method: Method
+    max_body_size: int | None = None
+    """
+    Maximum size of the request body in bytes for this route, or ``None``
+    to use the app's limit.
+    """
+    body_validator: Validator | None = None
+    """
+    Compiled validator for the request body of this route, or ``None`` if
+    the body isn't validated before the view is called.
+    """
+    bind_arguments: ArgumentBinder | None = None
+    """
+    Function that collects the arguments for the view from a request, or
+    ``None`` if the view doesn't take any.
+    """
 
     def __truediv__(self, other: object) -> str:
         if not isinstance(other, str):
@@ -163,9 +180,23 @@ class Router:
 
         return parent_node
 
-    def push_route(self, view: RouteView, path: str, method: Method) -> Route:
+    def push_route(
+        self,
+        view: RouteView,
+        path: str,
+        method: Method,
+        *,
+        max_body_size: int | None = None,
+        body: Any = None,
+    ) -> Route:
         """
         Register a view with the router.
+
+        If ``body`` is given, it's compiled into a validator for the JSON
+        request body right away, so a model is never introspected while
+        handling a request. The same goes for the view's signature, which
+        is turned into a function that binds its arguments; see
+        :func:`~view.core.parameters.compile_binder`.
         """
 
         if __debug__ and not callable(view):
@@ -177,7 +208,19 @@ class Router:
                 f"The route {path!r} was already used for method {method.value}"
             )
 
-        route = Route(view=view, path=path, method=method)
+        path_parameters = [
+            extract_path_parameter(part)
+            for part in path.split("/")
+            if is_path_parameter(part)
+        ]
+        route = Route(
+            view=view,
+            path=path,
+            method=method,
+            max_body_size=max_body_size,
+            body_validator=None if body is None else compile_validator(body),
+            bind_arguments=compile_binder(view, path_parameters, body=body),
+        )
         node.routes[method] = route
         return route
 
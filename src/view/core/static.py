@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from view.core.compression import (
+    AVAILABLE_ENCODINGS,
+    DEFAULT_COMPRESSIBLE_TYPES,
+    negotiate_encoding,
+)
+from view.core.headers import (
+    ACCEPT_ENCODING,
+    CONTENT_ENCODING,
+    CONTENT_LENGTH,
+    CONTENT_TYPE,
+    ETAG,
+    VARY,
+    FrozenHTTPHeaders,
+)
+from view.core.response import FileResponse, TextResponse, _guess_file_type
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+__all__ = (
+    "PrecompressedFiles",
+    "StaticFileCache",
+    "precompress_directory",
+    "precompressed_path",
+)
+
+PRECOMPRESSED_SUFFIXES: dict[str, str] = {
+    "br": ".br",
+    "zstd": ".zst",
+    "gzip": ".gz",
+}
+"""
+File suffixes used for precompressed siblings of a static file, keyed by
+their content coding.
+"""
+
+MAXIMUM_LEVELS: dict[str, int] = {"br": 11, "zstd": 19, "gzip": 9}
+
+
+def precompressed_path(file: Path, coding: str, /) -> Path:
+    """
+    Get the path of the precompressed sibling of ``file`` for a given
+    content coding.
+    """
+    return file.with_name(file.name + PRECOMPRESSED_SUFFIXES[coding])
+
+
+@dataclass(slots=True)
+class PrecompressedFiles:
+    """
+    Lookup for precompressed siblings of static files.
+
+    The siblings that exist for a file are only probed the first time that
+    file is served, so variants that are created or deleted afterwards
+    won't be noticed until :meth:`invalidate` is called.
+    """
+
+    encodings: Sequence[str] = ("br", "zstd", "gzip")
+    """
+    Content codings to look for, in order of preference.
+    """
+
+    _found: dict[Path, tuple[str, ...]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def invalidate(self) -> None:
+        """
+        Forget all cached lookups.
+        """
+        self._found.clear()
+
+    def codings_for(self, file: Path, /) -> tuple[str, ...]:
+        """
+        Get the content codings that have a precompressed sibling for the
+        given file.
+        """
+        codings = self._found.get(file)
+        if codings is None:
+            codings = tuple(
+                coding
+                for coding in self.encodings
+                if precompressed_path(file, coding).is_file()
+            )
+            self._found[file] = codings
+
+        return codings
+
+    def file_response(
+        self, file: Path, accept_encoding: str, /
+    ) -> FileResponse:
+        """
+        Serve the best variant of ``file`` for the given ``Accept-Encoding``
+        header value, falling back to the uncompressed file.
+        """
+        codings = self.codings_for(file)
+        if not codings:
+            return FileResponse.from_file(file)
+
+        coding = negotiate_encoding(accept_encoding, codings)
+        if coding is None:
+            return FileResponse.from_file(
+                file, headers={VARY: ACCEPT_ENCODING}
+            )
+
+        return FileResponse.from_file(
+            precompressed_path(file, coding),
+            headers={VARY: ACCEPT_ENCODING, CONTENT_ENCODING: coding},
+            content_type=_guess_file_type(file),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class _Representation:
+    body: bytes
+    headers: FrozenHTTPHeaders
+
+
+@dataclass(slots=True)
+class _CachedFile:
+    file: Path
+    mtime_ns: int
+    size: int
+    last_checked: float
+    identity: _Representation
+    encoded: dict[str, _Representation]
+
+    def response(self, accept_encoding: str) -> TextResponse[bytes]:
+        representation = self.identity
+        if self.encoded:
+            coding = negotiate_encoding(accept_encoding, list(self.encoded))
+            if coding is not None:
+                representation = self.encoded[coding]
+
+        return TextResponse.from_content(
+            representation.body, headers=representation.headers
+        )
+
+
+def _representation(
+    body: bytes,
+    content_type: str,
+    etag: str,
+    coding: str | None,
+    *,
+    vary: bool,
+) -> _Representation:
+    items = [
+        (CONTENT_TYPE, content_type),
+        (CONTENT_LENGTH, str(len(body))),
+    ]
+    if vary:
+        # Every representation has to advertise that it depends on
+        # Accept-Encoding, not just the compressed ones.
+        items.append((VARY, ACCEPT_ENCODING))
+
+    if coding is None:
+        items.append((ETAG, f'"{etag}"'))
+    else:
+        items.append((ETAG, f'"{etag}-{coding}"'))
+        items.append((CONTENT_ENCODING, coding))
+
+    return _Representation(body, FrozenHTTPHeaders(items))
+
+
+@dataclass(slots=True)
+class StaticFileCache:
+    """
+    Size-bounded LRU cache that keeps small static files in memory, along
+    with their precomputed headers.
+
+    Cached files are served without touching the filesystem, except for an
+    occasional modification time check to notice changes on disk.
+    """
+
+    max_size: int = 16 * 1024 * 1024
+    """
+    Total number of bytes that may be cached at once, including any
+    precompressed variants. Least recently used files are evicted first.
+    """
+
+    max_file_size: int = 256 * 1024
+    """
+    Files larger than this (in bytes) are never cached.
+    """
+
+    check_interval: float = 5.0
+    """
+    Minimum number of seconds between checks of a cached file's
+    modification time.
+    """
+
+    _entries: OrderedDict[str, _CachedFile] = field(
+        default_factory=OrderedDict, repr=False
+    )
+    _size: int = field(default=0, repr=False)
+
+    @property
+    def size(self) -> int:
+        """
+        The number of bytes currently held by the cache.
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self) -> None:
+        """
+        Evict everything from the cache.
+        """
+        self._entries.clear()
+        self._size = 0
+
+    def _evict(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+    def get(
+        self, key: str, accept_encoding: str, /
+    ) -> TextResponse[bytes] | None:
+        """
+        Get a response for a cached file, or ``None`` if it isn't cached
+        or has changed on disk.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        now = time.monotonic()
+        if now - entry.last_checked >= self.check_interval:
+            try:
+                mtime_ns: int | None = entry.file.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = None
+
+            if mtime_ns != entry.mtime_ns:
+                self._evict(key)
+                return None
+
+            entry.last_checked = now
+
+        self._entries.move_to_end(key)
+        return entry.response(accept_encoding)
+
+    async def load(
+        self,
+        key: str,
+        file: Path,
+        codings: Sequence[str],
+        accept_encoding: str,
+        /,
+    ) -> TextResponse[bytes] | None:
+        """
+        Read a file and its precompressed variants into the cache, and
+        return a response for it. If the file is too large to be cached,
+        this returns ``None``.
+        """
+        stat = file.stat()
+        if stat.st_size > min(self.max_file_size, self.max_size):
+            return None
+
+        def read() -> tuple[bytes, dict[str, bytes]]:
+            variants = {
+                coding: precompressed_path(file, coding).read_bytes()
+                for coding in codings
+            }
+            return file.read_bytes(), variants
+
+        body, variants = await asyncio.to_thread(read)
+        content_type = _guess_file_type(file)
+        etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+        vary = bool(variants)
+        identity = _representation(body, content_type, etag, None, vary=vary)
+        encoded = {
+            coding: _representation(
+                data, content_type, etag, coding, vary=vary
+            )
+            for coding, data in variants.items()
+        }
+
+        size = len(body) + sum(len(data) for data in variants.values())
+        entry = _CachedFile(
+            file, stat.st_mtime_ns, size, time.monotonic(), identity, encoded
+        )
+        if size > self.max_size:
+            return entry.response(accept_encoding)
+
+        if key in self._entries:
+            self._evict(key)
+
+        self._entries[key] = entry
+        self._size += size
+        while self._size > self.max_size:
+            self._evict(next(iter(self._entries)))
+
+        return entry.response(accept_encoding)
+
+
+def _precompress_file(file: Path, coding: str, level: int) -> Path:
+    compressor = AVAILABLE_ENCODINGS[coding](level)
+    data = compressor.compress(file.read_bytes()) + compressor.flush()
+
+    # Write to a temporary file first, so a running server never sees a
+    # partially written variant.
+    target = precompressed_path(file, coding)
+    temporary = target.with_name(target.name + ".tmp")
+    temporary.write_bytes(data)
+    os.replace(temporary, target)
+    return target
+
+
+def precompress_directory(
+    directory: str | Path,
+    /,
+    *,
+    encodings: Sequence[str] = ("br", "zstd", "gzip"),
+    levels: Mapping[str, int] = MAXIMUM_LEVELS,
+    content_types: frozenset[str] = DEFAULT_COMPRESSIBLE_TYPES,
+    minimum_size: int = 500,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """
+    Walk a directory and build precompressed siblings for every compressible
+    file in it, using a process pool. This is meant to be called once at
+    startup, before serving the directory with
+    :meth:`~view.core.app.App.static_files`.
+
+    Codings that aren't installed are skipped, codings missing from
+    ``levels`` use their maximum level, and variants that are newer than
+    their source file are left alone. The paths of all written
+    variants are returned.
+    """
+    directory = Path(directory)
+    codings = [coding for coding in encodings if coding in AVAILABLE_ENCODINGS]
+    suffixes = set(PRECOMPRESSED_SUFFIXES.values())
+    files: list[Path] = []
+    jobs_codings: list[str] = []
+    jobs_levels: list[int] = []
+
+    for file in directory.rglob("*"):
+        if file.suffix in suffixes or not file.is_file():
+            continue
+
+        if _guess_file_type(file) not in content_types:
+            continue
+
+        stat = file.stat()
+        if stat.st_size < minimum_size:
+            continue
+
+        for coding in codings:
+            target = precompressed_path(file, coding)
+            if target.exists() and target.stat().st_mtime >= stat.st_mtime:
+                continue
+
+            files.append(file)
+            jobs_codings.append(coding)
+            jobs_levels.append(levels.get(coding, MAXIMUM_LEVELS[coding]))
+
+    if not files:
+        return []
+
+    with ProcessPoolExecutor(max_workers) as executor:
+        return list(
+            executor.map(_precompress_file, files, jobs_codings, jobs_levels)
+        )
@@ -5,7 +5,8 @@ import traceback
 from enum import IntEnum
 from typing import ClassVar
 
-from view.core.response import TextResponse
+from view.core.headers import FrozenHTTPHeaders
+from view.core.response import PrebuiltResponse, TextResponse
 
 __all__ = "HTTPError", "Success", "status_exception"
 
@@ -166,16 +167,22 @@ access the message included with this HTTP error, use the
 """
 
 
+_NO_HEADERS = FrozenHTTPHeaders()
+
+
 class HTTPError(Exception):
     """
     Base class for all HTTP errors.
 
     Raising this type, or a subclass of this type, will be converted
-    to a status code at runtime.
+    to a status code at runtime. Views can also return an error (either
+    the class or an instance) instead of raising it, which skips the
+    exception machinery entirely.
     """
 
     status_code: ClassVar[int] = 0
     description: ClassVar[str] = ""
+    _default_response: ClassVar[PrebuiltResponse | None] = None
 
     def __init__(self, *msg: object) -> None:
         if msg:
@@ -183,7 +190,11 @@ class HTTPError(Exception):
         else:
             self.message = None
 
-        if sys.version_info < (3, 11):
+        if not __debug__:
+            # The note is only there to help with debugging, and building
+            # it isn't free for errors that are raised for control flow.
+            super().__init__(*msg)
+        elif sys.version_info < (3, 11):
             super().__init__(*msg, HTTP_ERROR_TRACEBACK_NOTE)
         else:
             super().__init__(*msg)
@@ -194,22 +205,46 @@ class HTTPError(Exception):
             assert cls.status_code != 0, cls
             STATUS_EXCEPTIONS[cls.status_code] = cls
             cls.description = STATUS_STRINGS[cls.status_code]
+            # Errors without a message all look the same, so their response
+            # is only ever rendered once.
+            cls._default_response = PrebuiltResponse.from_body(
+                f"{cls.status_code} {cls.description}".encode(),
+                cls.status_code,
+                _NO_HEADERS,
+            )
 
         # It's too much of a hassle to add an explicit __all__ with every status code.
         global __all__  # noqa: PLW0603
         __all__ += (cls.__name__,)
 
-    def as_response(self) -> TextResponse[str]:
-        cls = type(self)
+    @classmethod
+    def default_response(cls) -> TextResponse[str] | TextResponse[bytes]:
+        """
+        Get the response for this error without a custom message, without
+        creating an instance of it.
+        """
         if cls.status_code == 0:
             raise TypeError(f"{cls} is not a real response")
 
+        default = cls._default_response
+        if default is not None:
+            return default.response()
+
+        return TextResponse.from_content(
+            f"{cls.status_code} {cls.description}", status_code=cls.status_code
+        )
+
+    def as_response(self) -> TextResponse[str] | TextResponse[bytes]:
         if self.message is None:
-            message = f"{cls.status_code} {cls.description}"
-        else:
-            message = self.message
+            return self.default_response()
+
+        cls = type(self)
+        if cls.status_code == 0:
+            raise TypeError(f"{cls} is not a real response")
 
-        return TextResponse.from_content(message, status_code=cls.status_code)
+        return TextResponse.from_content(
+            self.message, status_code=cls.status_code
+        )
 
 
 def status_exception(status: int) -> type[HTTPError]:
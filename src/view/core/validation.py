@@ -0,0 +1,419 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import types
+import typing
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, Literal, TypeAlias, Union
+
+from view.exceptions import ViewError
+
+__all__ = (
+    "ValidationError",
+    "Validator",
+    "compile_validator",
+)
+
+Validator: TypeAlias = Callable[[Any], Any]
+
+
+class ValidationError(ViewError):
+    """
+    Decoded data doesn't match the model it was validated against.
+
+    If this occurred when validating the body for a request, the fix is
+    usually to reraise this with an error 400 (Bad Request).
+    """
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.location: list[str | int] = []
+        """
+        Keys and indices leading to the invalid value, innermost first.
+        """
+
+    @property
+    def path(self) -> str:
+        """
+        Where the invalid value is, such as ``items[0].name``, or an empty
+        string if the top-level value itself is invalid.
+        """
+        parts: list[str] = []
+        for part in reversed(self.location):
+            if isinstance(part, int):
+                parts.append(f"[{part}]")
+            elif parts:
+                parts.append(f".{part}")
+            else:
+                parts.append(part)
+
+        return "".join(parts)
+
+    def __str__(self) -> str:
+        path = self.path
+        if path:
+            return f"{path}: {self.reason}"
+
+        return self.reason
+
+
+_JSON_TYPE_NAMES: dict[type, str] = {
+    dict: "object",
+    list: "array",
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    type(None): "null",
+}
+
+
+def _mismatch(expected: str, value: Any) -> ValidationError:
+    got = _JSON_TYPE_NAMES.get(type(value), type(value).__name__)
+    return ValidationError(f"expected {expected}, got {got}")
+
+
+def _validate_any(value: Any) -> Any:
+    return value
+
+
+def _validate_none(value: Any) -> None:
+    if value is not None:
+        raise _mismatch("null", value)
+
+
+def _validate_str(value: Any) -> str:
+    if type(value) is not str:
+        raise _mismatch("a string", value)
+
+    return value
+
+
+def _validate_int(value: Any) -> int:
+    # Checking the exact type also rules out booleans.
+    if type(value) is not int:
+        raise _mismatch("an integer", value)
+
+    return value
+
+
+def _validate_float(value: Any) -> float:
+    kind = type(value)
+    if kind is float:
+        return value
+
+    if kind is int:
+        return float(value)
+
+    raise _mismatch("a number", value)
+
+
+def _validate_bool(value: Any) -> bool:
+    if type(value) is not bool:
+        raise _mismatch("a boolean", value)
+
+    return value
+
+
+_SIMPLE_VALIDATORS: dict[object, Validator] = {
+    Any: _validate_any,
+    object: _validate_any,
+    None: _validate_none,
+    type(None): _validate_none,
+    str: _validate_str,
+    int: _validate_int,
+    float: _validate_float,
+    bool: _validate_bool,
+}
+
+
+def _is_typeddict(hint: object) -> bool:
+    # typing.is_typeddict() isn't available on Python 3.9.
+    return (
+        isinstance(hint, type)
+        and issubclass(hint, dict)
+        and hasattr(hint, "__required_keys__")
+    )
+
+
+def _compile_literal(arguments: tuple[Any, ...]) -> Validator:
+    # Compare types too, so that True doesn't match 1.
+    allowed = frozenset((type(argument), argument) for argument in arguments)
+    expected = " or ".join(repr(argument) for argument in arguments)
+
+    def validate(value: Any) -> Any:
+        # Checking the type first keeps unhashable values out of the set.
+        scalar = value is None or isinstance(value, (str, int, float))
+        if scalar and (type(value), value) in allowed:
+            return value
+
+        raise ValidationError(f"expected {expected}, got {value!r}")
+
+    return validate
+
+
+def _compile_union(
+    arguments: tuple[Any, ...], compiling: dict[object, Validator]
+) -> Validator:
+    options = [
+        argument for argument in arguments if argument is not type(None)
+    ]
+    if len(options) == 1 and len(arguments) == 2:  # noqa: PLR2004
+        inner = _compile(options[0], compiling)
+
+        def validate_optional(value: Any) -> Any:
+            if value is None:
+                return None
+
+            return inner(value)
+
+        return validate_optional
+
+    validators = [_compile(argument, compiling) for argument in arguments]
+    expected = " | ".join(
+        getattr(argument, "__name__", repr(argument)) for argument in arguments
+    )
+
+    def validate(value: Any) -> Any:
+        for validator in validators:
+            try:
+                return validator(value)
+            except ValidationError:
+                continue
+
+        raise _mismatch(expected, value)
+
+    return validate
+
+
+def _compile_list(
+    item_hint: Any, compiling: dict[object, Validator], *, as_tuple: bool
+) -> Validator:
+    validate_item = _compile(item_hint, compiling)
+    if validate_item is _validate_any:
+
+        def validate_any_items(value: Any) -> Any:
+            if type(value) is not list:
+                raise _mismatch("an array", value)
+
+            return tuple(value) if as_tuple else value
+
+        return validate_any_items
+
+    def validate(value: Any) -> Any:
+        if type(value) is not list:
+            raise _mismatch("an array", value)
+
+        result = []
+        for index, item in enumerate(value):
+            try:
+                result.append(validate_item(item))
+            except ValidationError as error:
+                error.location.append(index)
+                raise
+
+        return tuple(result) if as_tuple else result
+
+    return validate
+
+
+def _compile_fixed_tuple(
+    item_hints: tuple[Any, ...], compiling: dict[object, Validator]
+) -> Validator:
+    validators = [_compile(hint, compiling) for hint in item_hints]
+    length = len(validators)
+
+    def validate(value: Any) -> tuple[Any, ...]:
+        if type(value) is not list:
+            raise _mismatch("an array", value)
+
+        if len(value) != length:
+            raise ValidationError(f"expected {length} items, got {len(value)}")
+
+        result = []
+        for index, (validator, item) in enumerate(zip(validators, value)):
+            try:
+                result.append(validator(item))
+            except ValidationError as error:
+                error.location.append(index)
+                raise
+
+        return tuple(result)
+
+    return validate
+
+
+def _compile_dict(
+    key_hint: Any, value_hint: Any, compiling: dict[object, Validator]
+) -> Validator:
+    if key_hint not in {str, Any}:
+        raise TypeError(
+            f"Object keys are always strings, so {key_hint!r} can't be"
+            " used as a key type"
+        )
+
+    validate_item = _compile(value_hint, compiling)
+
+    def validate(value: Any) -> dict[str, Any]:
+        if type(value) is not dict:
+            raise _mismatch("an object", value)
+
+        if validate_item is _validate_any:
+            return value
+
+        result = {}
+        for key, item in value.items():
+            try:
+                result[key] = validate_item(item)
+            except ValidationError as error:
+                error.location.append(key)
+                raise
+
+        return result
+
+    return validate
+
+
+_MISSING: Any = object()
+
+
+def _compile_fields(
+    model: type, compiling: dict[object, Validator]
+) -> list[tuple[str, Validator, bool]]:
+    hints = typing.get_type_hints(model)
+    if dataclasses.is_dataclass(model):
+        return [
+            (
+                item.name,
+                _compile(hints[item.name], compiling),
+                item.default is dataclasses.MISSING
+                and item.default_factory is dataclasses.MISSING,
+            )
+            for item in dataclasses.fields(model)
+            if item.init
+        ]
+
+    required_keys: frozenset[str] = model.__required_keys__  # type: ignore
+    return [
+        (name, _compile(hint, compiling), name in required_keys)
+        for name, hint in hints.items()
+    ]
+
+
+def _compile_model(
+    model: type, compiling: dict[object, Validator]
+) -> Validator:
+    existing = compiling.get(model)
+    if existing is not None:
+        return existing
+
+    # A model can refer to itself, so give any references a stand-in that
+    # calls the real validator once it has been compiled.
+    compiled: list[Validator] = []
+
+    def validate_recursive(value: Any) -> Any:
+        return compiled[0](value)
+
+    compiling[model] = validate_recursive
+    fields = _compile_fields(model, compiling)
+    construct: Callable[..., Any] = (
+        model if dataclasses.is_dataclass(model) else dict
+    )
+
+    def validate(value: Any) -> Any:
+        if type(value) is not dict:
+            raise _mismatch("an object", value)
+
+        arguments: dict[str, Any] = {}
+        for name, validate_field, required in fields:
+            item = value.get(name, _MISSING)
+            if item is _MISSING:
+                if required:
+                    error = ValidationError("field is required")
+                    error.location.append(name)
+                    raise error
+
+                continue
+
+            try:
+                arguments[name] = validate_field(item)
+            except ValidationError as error:
+                error.location.append(name)
+                raise
+
+        try:
+            return construct(**arguments)
+        except (TypeError, ValueError) as error:
+            # Raised by checks in a dataclass's __post_init__(), which
+            # reject the data rather than the model.
+            raise ValidationError(str(error)) from error
+
+    compiled.append(validate)
+    compiling[model] = validate
+    return validate
+
+
+def _compile(hint: Any, compiling: dict[object, Validator]) -> Validator:
+    try:
+        simple = _SIMPLE_VALIDATORS.get(hint)
+    except TypeError:
+        # Unhashable annotation
+        simple = None
+
+    if simple is not None:
+        return simple
+
+    if dataclasses.is_dataclass(hint) or _is_typeddict(hint):
+        return _compile_model(hint, compiling)
+
+    origin = typing.get_origin(hint)
+    arguments = typing.get_args(hint)
+    if origin is typing.Annotated:
+        return _compile(arguments[0], compiling)
+
+    if origin is Literal:
+        return _compile_literal(arguments)
+
+    if origin is Union or (
+        hasattr(types, "UnionType") and origin is types.UnionType
+    ):
+        return _compile_union(arguments, compiling)
+
+    if hint is list or origin in {list, Sequence}:
+        return _compile_list(
+            arguments[0] if arguments else Any, compiling, as_tuple=False
+        )
+
+    if hint is tuple or origin is tuple:
+        if not arguments or (len(arguments) == 2 and arguments[1] is ...):  # noqa: PLR2004
+            return _compile_list(
+                arguments[0] if arguments else Any, compiling, as_tuple=True
+            )
+
+        return _compile_fixed_tuple(arguments, compiling)
+
+    if hint is dict or origin in {dict, Mapping}:
+        key_hint, value_hint = arguments or (str, Any)
+        return _compile_dict(key_hint, value_hint, compiling)
+
+    raise TypeError(f"{hint!r} is not supported for validation")
+
+
+@functools.cache
+def compile_validator(model: Any, /) -> Validator:
+    """
+    Build a function that checks decoded JSON data against ``model`` and
+    converts it, raising :class:`ValidationError` if it doesn't match.
+
+    ``model`` is usually a dataclass or :class:`~typing.TypedDict`, whose
+    fields may use strings, numbers, booleans, ``None``, lists, tuples,
+    dictionaries, unions, literals, and other models. Dataclasses are
+    instantiated, while typed dictionaries are returned as plain
+    dictionaries. Keys that aren't part of a model are dropped.
+
+    All type introspection happens here, and the result is cached, so a
+    model is only ever compiled once.
+    """
+    return _compile(model, {})
@@ -15,7 +15,7 @@ from io import StringIO
 from queue import LifoQueue
 from typing import TYPE_CHECKING, ClassVar, ParamSpec, TypeAlias
 
-from view.core.headers import as_real_headers
+from view.core.headers import CONTENT_TYPE, FrozenHTTPHeaders
 from view.core.response import Response
 from view.exceptions import InvalidTypeError
 from view.javascript import SupportsJavaScript
@@ -26,6 +26,7 @@ if TYPE_CHECKING:
 __all__ = ("HTMLNode", "html_response")
 
 HTMLTree: TypeAlias = Iterator["HTMLNode"]
+_HTML_HEADERS = FrozenHTTPHeaders([(CONTENT_TYPE, "text/html")])
 
 
 def _indent_iterator(iterator: Iterator[str]) -> Iterator[str]:
@@ -217,7 +218,7 @@ def html_response(
         return Response(
             stream,
             status_code or 200,
-            as_real_headers({"content-type": "text/html"}),
+            _HTML_HEADERS,
         )
 
     return wrapper
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from typing import TYPE_CHECKING, Any, Literal, TypeAlias, TypedDict
 
 from typing_extensions import NotRequired
 
-from view.core.headers import asgi_to_headers, headers_to_asgi
-from view.core.request import Method, Request, extract_query_parameters
+from view.core.headers import (
+    CONTENT_LENGTH,
+    asgi_to_headers,
+    headers_to_asgi,
+)
+from view.core.request import Method, Request, RequestPool
 
 if TYPE_CHECKING:
     from view.core.app import BaseApp
+    from view.core.response import Response
 
 __all__ = ("asgi_for_app",)
 
@@ -47,6 +53,10 @@ class ASGIHttpReceiveResult(ASGIBodyMixin, TypedDict):
     type: Literal["http.request"]
 
 
+class ASGIHttpDisconnect(TypedDict):
+    type: Literal["http.disconnect"]
+
+
 class ASGIHttpSendStart(TypedDict):
     type: Literal["http.response.start"]
     status: int
@@ -58,7 +68,9 @@ class ASGIHttpSendBody(ASGIBodyMixin, TypedDict):
     type: Literal["http.response.body"]
 
 
-ASGIHttpReceive: TypeAlias = Callable[[], Awaitable[ASGIHttpReceiveResult]]
+ASGIHttpReceive: TypeAlias = Callable[
+    [], Awaitable[ASGIHttpReceiveResult | ASGIHttpDisconnect]
+]
 ASGIHttpSend: TypeAlias = Callable[
     [ASGIHttpSendStart | ASGIHttpSendBody], Awaitable[None]
 ]
@@ -67,15 +79,73 @@ ASGIProtocol: TypeAlias = Callable[
 ]
 
 
-def asgi_for_app(app: BaseApp, /) -> ASGIProtocol:
+async def _send_until_disconnect(
+    response: Response, receive: ASGIHttpReceive, send: ASGIHttpSend
+) -> None:
+    async def forward() -> None:
+        chunks = response.stream_body()
+        try:
+            async for data in chunks:
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": data,
+                        "more_body": True,
+                    }
+                )
+        finally:
+            await chunks.aclose()
+
+        await send({"type": "http.response.body", "more_body": False})
+
+    async def wait_for_disconnect() -> None:
+        # Anything left of the request body is skipped.
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    sender = asyncio.ensure_future(forward())
+    watcher = asyncio.ensure_future(wait_for_disconnect())
+    try:
+        await asyncio.wait(
+            {sender, watcher}, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        # Cancelling the sender also cancels whatever is producing the body.
+        sender.cancel()
+        watcher.cancel()
+        await asyncio.wait({sender, watcher})
+
+    if not sender.cancelled():
+        # Reraise any error from the response
+        sender.result()
+
+
+def asgi_for_app(
+    app: BaseApp,
+    /,
+    *,
+    coalesce_size: int = 0,
+    request_pool: RequestPool | None = None,
+) -> ASGIProtocol:
     """
     Generate an ASGI-compliant callable for a given app, allowing
     it to be executed in an ASGI server.
 
+    Consecutive body chunks are gathered into a single message until they
+    would exceed ``coalesce_size`` bytes. By default, every chunk is sent
+    as soon as the next one is available.
+
+    If a ``request_pool`` is given, request objects are taken from it and
+    returned once their response has been sent.
+
     Don't use this directly; prefer the :meth:`view.core.app.BaseApp.wsgi`
     method instead.
     """
 
+    new_request = (
+        Request.from_server if request_pool is None else request_pool.acquire
+    )
+
     async def asgi(
         scope: ASGIHttpScope, receive: ASGIHttpReceive, send: ASGIHttpSend
     ) -> None:
@@ -91,26 +161,66 @@ def asgi_for_app(app: BaseApp, /) -> ASGIProtocol:
                 yield data.get("body", b"")
                 more_body = data.get("more_body", False)
 
-        parameters = extract_query_parameters(scope["query_string"])
-        request = Request(
-            receive_data, app, scope["path"], method, headers, parameters
+        request = new_request(
+            receive_data,
+            app,
+            scope["path"],
+            method,
+            headers,
+            scope["query_string"],
         )
 
         response = await app.process_request(request)
+        response_headers = headers_to_asgi(response.headers)
+        if (
+            response.content_length is not None
+            and CONTENT_LENGTH not in response.headers
+        ):
+            response_headers.append(
+                (b"content-length", str(response.content_length).encode())
+            )
+
         await send(
             {
                 "type": "http.response.start",
                 "status": response.status_code,
-                "headers": headers_to_asgi(response.headers),
+                "headers": response_headers,
             }
         )
+        if response.long_lived:
+            await _send_until_disconnect(response, receive, send)
+            if request_pool is not None:
+                request_pool.release(request)
+            return
+
+        # Chunks are held back until the next one arrives, so the last one
+        # can be sent with more_body=False instead of needing an extra empty
+        # message.
+        pending: list[bytes] = []
+        pending_size = 0
         async for data in response.stream_body():
-            await send(
-                {"type": "http.response.body", "body": data, "more_body": True}
-            )
+            if pending and pending_size + len(data) > coalesce_size:
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": b"".join(pending),
+                        "more_body": True,
+                    }
+                )
+                pending.clear()
+                pending_size = 0
+
+            pending.append(data)
+            pending_size += len(data)
 
         await send(
-            {"type": "http.response.body", "body": b"", "more_body": False}
+            {
+                "type": "http.response.body",
+                "body": b"".join(pending),
+                "more_body": False,
+            }
         )
+        if request_pool is not None:
+            request_pool.release(request)
 
     return asgi
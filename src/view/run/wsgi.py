@@ -4,8 +4,12 @@ import asyncio
 from collections.abc import Callable, Iterable
 from typing import IO, TYPE_CHECKING, Any, TypeAlias
 
-from view.core.headers import headers_to_wsgi, wsgi_to_headers
-from view.core.request import Method, Request, extract_query_parameters
+from view.core.headers import (
+    CONTENT_LENGTH,
+    headers_to_wsgi,
+    wsgi_to_headers,
+)
+from view.core.request import Method, Request
 from view.core.status_codes import STATUS_STRINGS
 
 if TYPE_CHECKING:
@@ -56,17 +60,25 @@ def wsgi_for_app(
         path = environ["PATH_INFO"]
         assert isinstance(path, str)
         headers = wsgi_to_headers(environ)
-        parameters = extract_query_parameters(environ["QUERY_STRING"])
-        request = Request(stream, app, path, method, headers, parameters)
+        # PEP 3333 passes the query string as latin-1 decoded bytes.
+        query = environ.get("QUERY_STRING", "").encode("latin-1")
+        request = Request.from_server(
+            stream, app, path, method, headers, query
+        )
         response = loop.run_until_complete(app.process_request(request))
 
-        wsgi_headers: WSGIHeaders = headers_to_wsgi(response.headers)
+        body = loop.run_until_complete(response.body())
+        wsgi_headers = headers_to_wsgi(response.headers)
+        if CONTENT_LENGTH not in response.headers:
+            # The whole body is in memory at this point, so the length is
+            # always known.
+            wsgi_headers.append((CONTENT_LENGTH, str(len(body))))
 
         # WSGI is such a weird spec
         status_str = (
             f"{response.status_code} {STATUS_STRINGS[response.status_code]}"
         )
         start_response(status_str, wsgi_headers)
-        return [loop.run_until_complete(response.body())]
+        return [body]
 
     return wsgi
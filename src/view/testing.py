@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from view.core.headers import HeadersLike, as_real_headers
-from view.core.request import Method, Request, extract_query_parameters
+from view.core.request import Method, Request
 from view.core.status_codes import STATUS_STRINGS
 
 if TYPE_CHECKING:
@@ -76,7 +76,7 @@ class AppTestClient:
             path=path,
             method=method,
             headers=as_real_headers(headers),
-            query_parameters=extract_query_parameters(query_string),
+            raw_query=query_string.encode("utf-8"),
         )
         return await self.app.process_request(request_data)
 
@@ -1,7 +1,15 @@
 import pytest
 from view.core.app import App, as_app
 from view.exceptions import InvalidTypeError
-from view.core.multi_map import HasMultipleValuesError, MultiMap
+from view.core.headers import (
+    FrozenHTTPHeaders,
+    HTTPHeaders,
+    MutableHTTPHeaders,
+    as_real_headers,
+    headers_to_asgi,
+)
+from view.core.multi_map import HasMultipleValuesError, MultiMap, MutableMultiMap
+from view.core.response import FileResponse
 
 
 def test_as_app_invalid():
@@ -132,3 +140,127 @@ def test_multi_map_with_new_value():
     assert new_map["c"] == 4
     assert new_map.get_exactly_one("c") == 4
     assert new_map.get_many("b") == [2, 3, 4]
+
+
+def test_multi_map_views():
+    multi_map = MutableMultiMap([("a", 1), ("b", 2)])
+    values = multi_map.values()
+    items = multi_map.items()
+    sequence = multi_map.as_sequence()
+
+    multi_map.add("a", 3)
+    multi_map.add("c", 4)
+
+    # Views reflect changes, because nothing was copied
+    assert list(values) == [1, 2, 4]
+    assert list(items) == [("a", 1), ("b", 2), ("c", 4)]
+    assert ("a", 1) in items
+    assert ("a", 3) not in items
+    assert 4 in values
+    assert sequence == [("a", 1), ("b", 2), ("a", 3), ("c", 4)]
+    assert multi_map.get_many("a") == [1, 3]
+
+
+def test_mutable_multi_map():
+    multi_map = MutableMultiMap([("a", 1), ("a", 2), ("b", 3)])
+    multi_map["a"] = 4
+    assert multi_map.get_many("a") == [4]
+    assert multi_map.as_sequence() == [("b", 3), ("a", 4)]
+
+    del multi_map["b"]
+    assert "b" not in multi_map
+    assert multi_map.as_sequence() == [("a", 4)]
+
+    with pytest.raises(KeyError):
+        del multi_map["b"]
+
+    with pytest.raises(TypeError):
+        hash(multi_map)
+
+    frozen = MultiMap([("a", 1), ("a", 2)])
+    assert hash(frozen) == hash(MultiMap([("a", 1), ("a", 2)]))
+    assert not hasattr(frozen, "add")
+
+
+def test_mutable_headers():
+    headers = MutableHTTPHeaders({"Content-Type": "text/plain"}.items())
+    headers.add("Set-Cookie", "a")
+    headers.add("set-cookie", "b")
+    headers["CONTENT-TYPE"] = "text/html"
+
+    assert headers["content-type"] == "text/html"
+    assert headers.get_many("Set-Cookie") == ["a", "b"]
+    assert repr(headers) == (
+        "MutableHTTPHeaders([('set-cookie', 'a'), ('set-cookie', 'b'), "
+        "('content-type', 'text/html')])"
+    )
+
+    original = as_real_headers(HTTPHeaders([("a", "b")]))
+    response = FileResponse.from_file(__file__, headers=original)
+    assert "content-type" not in original
+    assert response.headers["content-type"] == "text/x-python"
+
+
+def test_frozen_headers():
+    headers = FrozenHTTPHeaders({"Content-Type": "text/html", "X-Test": "1"})
+    assert as_real_headers(headers) is headers
+    assert headers["content-type"] == "text/html"
+    assert not isinstance(headers, MutableHTTPHeaders)
+
+    encoded = headers_to_asgi(headers)
+    assert encoded == [(b"content-type", b"text/html"), (b"x-test", b"1")]
+    encoded.append((b"content-length", b"0"))
+    assert headers_to_asgi(headers) == [
+        (b"content-type", b"text/html"),
+        (b"x-test", b"1"),
+    ]
+    assert headers_to_asgi(headers)[0] is headers_to_asgi(headers)[0]
+    assert headers.encode_asgi() is headers.encode_asgi()
+
+    response = FileResponse.from_file(__file__, headers=FrozenHTTPHeaders())
+    assert response.headers["content-type"] == "text/x-python"
+
+
+class CompactMultiMap(MultiMap):
+    __slots__ = ()
+    COMPACT_SIZE = 16
+
+
+@pytest.mark.parametrize("cls", [MultiMap, CompactMultiMap])
+@pytest.mark.parametrize("size", [0, 1, 8, 16, 17, 100])
+def test_multi_map_sizes(cls: type[MultiMap], size: int):
+    items = [(str(number % 7), number) for number in range(size)]
+    multi_map = cls(items)
+    expected: dict[str, list[int]] = {}
+    for key, value in items:
+        expected.setdefault(key, []).append(value)
+
+    assert len(multi_map) == len(expected)
+    assert list(multi_map) == list(expected)
+    assert list(multi_map.many_items()) == list(expected.items())
+    assert multi_map == {key: values[0] for key, values in expected.items()}
+    assert multi_map.as_sequence() == items
+    for key, values in expected.items():
+        assert multi_map[key] == values[0]
+        assert multi_map.get_many(key) == values
+
+    assert "missing" not in multi_map
+
+
+def test_mutable_multi_map_growth():
+    multi_map = MutableMultiMap[str, int]()
+    for number in range(40):
+        multi_map.add(str(number % 20), number)
+        assert multi_map[str(number % 20)] == number % 20
+
+    assert len(multi_map) == 20
+    assert multi_map.get_many("1") == [1, 21]
+    multi_map["1"] = 0
+    del multi_map["2"]
+    assert multi_map.get_many("1") == [0]
+    assert "2" not in multi_map
+    assert len(multi_map) == 19
+
+    headers = HTTPHeaders([(f"X-Header-{number}", "a") for number in range(40)])
+    assert headers["x-header-39"] == "a"
+    assert headers["X-Header-0"] == "a"
@@ -1,15 +1,31 @@
 import json
+import os
+import urllib.parse
 from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Annotated, Literal, TypedDict
 
 import pytest
 from view.core.app import App, as_app
-from view.core.body import InvalidJSONError
-from view.core.headers import as_real_headers
-from view.core.request import Method, Request
+from view.core.body import BodyAlreadyUsedError, InvalidJSONError
+from view.core.headers import (
+    CONTENT_TYPE,
+    HTTPHeaders,
+    LazyHTTPHeaders,
+    as_real_headers,
+    asgi_to_headers,
+    header_name,
+    headers_to_asgi,
+    headers_to_wsgi,
+)
+from view.core.request import Method, Request, extract_query_parameters
 from view.core.response import ResponseLike
 from view.core.router import DuplicateRouteError
-from view.core.status_codes import BadRequest
-from view.core.multi_map import MultiMap
+from view.core.multipart import InvalidMultipartError, MultipartSettings
+from view.core.parameters import Header, Query, UnresolvableParameterError
+from view.core.status_codes import BadRequest, ContentTooLarge
+from view.core.validation import ValidationError, compile_validator
+from view.core.multi_map import HasMultipleValuesError
 from view.testing import AppTestClient, bad, into_tuple, ok
 
 
@@ -62,7 +78,6 @@ async def test_manual_request():
         path="/",
         method=Method.POST,
         headers=as_real_headers({"test": "42"}),
-        query_parameters=MultiMap(),
     )
     response = await app.process_request(manual_request)
     assert (await response.body()) == b"1"
@@ -328,6 +343,33 @@ async def test_request_query_parameters():
     assert (await into_tuple(client.get("/?foo=bar&test=1&test=2&test=3"))) == ok("ok")
 
 
+@pytest.mark.asyncio
+async def test_request_raw_query():
+    app = App()
+
+    @app.get("/")
+    async def main():
+        request = app.current_request()
+        assert request._query_parameters is None
+        assert request.raw_query == b"name=J%C3%BCrgen&a=1&a"
+        assert request._query_parameters is None
+
+        assert request.query_parameters["name"] == "Jürgen"
+        assert request.query_parameters is request.query_parameters
+        return "ok"
+
+    @app.get("/empty")
+    async def empty():
+        request = app.current_request()
+        assert request.raw_query == b""
+        assert len(request.query_parameters) == 0
+        return "ok"
+
+    client = AppTestClient(app)
+    assert (await into_tuple(client.get("/?name=J%C3%BCrgen&a=1&a"))) == ok("ok")
+    assert (await into_tuple(client.get("/empty"))) == ok("ok")
+
+
 @pytest.mark.asyncio
 async def test_subrouters():
     app = App()
@@ -355,3 +397,587 @@ async def test_subrouters():
 
     with pytest.raises(RuntimeError):
         app.subrouter("/{test}/x")(main)
+
+
+def test_lazy_asgi_headers():
+    raw = [(b"host", b"example.com"), (b"accept", b"a"), (b"accept", b"b")]
+    headers = asgi_to_headers(raw)
+    assert isinstance(headers, LazyHTTPHeaders)
+    assert headers["HOST"] == "example.com"
+    assert headers.get_many("accept") == ["a", "b"]
+    assert "x-missing" not in headers
+    assert headers.get("x-missing") is None
+    assert 1 not in headers
+
+    with pytest.raises(HasMultipleValuesError):
+        headers.get_exactly_one("accept")
+
+    assert headers == {"host": "example.com", "accept": "a"}
+    assert len(headers) == 2
+    assert headers_to_asgi(headers) == raw
+    assert headers_to_asgi(headers) is not raw
+
+    new_headers = headers.with_new_value("X-Test", "1")
+    assert not isinstance(new_headers, LazyHTTPHeaders)
+    assert new_headers["x-test"] == "1"
+    assert new_headers.get_many("accept") == ["a", "b"]
+
+
+def test_header_names():
+    headers = HTTPHeaders([("Content-Type", "text/html"), ("Set-Cookie", "a"), ("set-cookie", "b")])
+    assert list(headers.keys()) == ["content-type", "set-cookie"]
+    assert headers["CONTENT-TYPE"] == "text/html"
+    assert headers[CONTENT_TYPE] == "text/html"
+    assert "Set-Cookie" in headers
+    assert object() not in headers
+    assert headers.get_many("SET-COOKIE") == ["a", "b"]
+    assert header_name("X-Custom") == "x-custom"
+    assert header_name("Content-Type") is CONTENT_TYPE
+    assert header_name("X-Custom") == header_name("x-CUSTOM")
+    assert next(iter(headers)) is CONTENT_TYPE
+
+    assert headers_to_asgi(headers) == [
+        (b"content-type", b"text/html"),
+        (b"set-cookie", b"a"),
+        (b"set-cookie", b"b"),
+    ]
+    assert headers_to_wsgi(headers) == [
+        ("content-type", "text/html"),
+        ("set-cookie", "a"),
+        ("set-cookie", "b"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "path,normalized",
+    [("/", "/"), ("", "/"), ("/foo", "/foo"), ("/foo/", "/foo"), ("foo/bar//", "/foo/bar")],
+)
+def test_request_from_server(path: str, normalized: str):
+    app = App()
+
+    async def stream_none() -> AsyncIterator[bytes]:
+        yield b""
+
+    headers = as_real_headers(None)
+    request = Request.from_server(stream_none, app, path, Method.GET, headers, b"a=1")
+    assert request == Request(stream_none, app, path, Method.GET, headers, b"a=1")
+    assert request.path == normalized
+    assert request.query_parameters["a"] == "1"
+    assert request.path_parameters == {}
+
+
+@pytest.mark.asyncio
+async def test_request_max_body_size():
+    app = App(max_body_size=4)
+    received: list[bytes] = []
+
+    @app.post("/")
+    async def index() -> ResponseLike:
+        return await app.current_request().body()
+
+    @app.post("/stream")
+    async def stream() -> ResponseLike:
+        async for data in app.current_request().stream_body():
+            received.append(data)
+        return "ok"
+
+    @app.post("/large", max_body_size=8)
+    async def large() -> ResponseLike:
+        return await app.current_request().body()
+
+    client = AppTestClient(app)
+    assert (await into_tuple(client.post("/", body=b"1234"))) == ok(b"1234")
+    assert (await into_tuple(client.post("/", body=b"12345"))) == bad(413)
+    assert (await into_tuple(client.post("/large", body=b"12345"))) == ok(b"12345")
+    assert (await into_tuple(client.post("/large", body=b"123456789"))) == bad(413)
+
+    # A declared length is rejected before anything is read
+    response = client.post("/stream", body=b"", headers={"Content-Length": "5"})
+    assert (await into_tuple(response)) == bad(413)
+    assert received == []
+
+
+@pytest.mark.asyncio
+async def test_request_body_limit_stops_reading():
+    app = App(max_body_size=4)
+    chunks_read = 0
+
+    @app.post("/")
+    async def index() -> ResponseLike:
+        return await app.current_request().body()
+
+    async def chunks() -> AsyncIterator[bytes]:
+        nonlocal chunks_read
+        for _ in range(10):
+            chunks_read += 1
+            yield b"123"
+
+    request = Request(chunks, app, "/", Method.POST, as_real_headers(None))
+    assert (await into_tuple(app.process_request(request))) == bad(413)
+    assert chunks_read == 2
+
+
+@pytest.mark.asyncio
+async def test_request_body_copies():
+    app = App()
+    payload = b"x" * 1024
+
+    async def one_chunk() -> AsyncIterator[bytes]:
+        yield payload
+
+    async def many_chunks() -> AsyncIterator[bytes]:
+        yield payload[:100]
+        yield b""
+        yield payload[100:]
+
+    request = Request(one_chunk, app, "/", Method.POST, as_real_headers(None))
+    assert (await request.body()) is payload
+
+    request = Request(many_chunks, app, "/", Method.POST, as_real_headers(None))
+    assert (await request.body()) == payload
+
+
+MULTIPART_BODY = (
+    b"preamble\r\n"
+    b"--boundary\r\n"
+    b'Content-Disposition: form-data; name="field"\r\n'
+    b"\r\n"
+    b"value\r\n"
+    b"--boundary  \r\n"
+    b'Content-Disposition: form-data; name="file"; filename="a \\"b\\".txt"\r\n'
+    b"Content-Type: application/octet-stream\r\n"
+    b"\r\n"
+    b"\r\n--boundar\r\n-- data\r\n"
+    b"--boundary\r\n"
+    b"Content-Disposition: form-data; name=unicode; filename*=UTF-8''na%C3%AFve.txt\r\n"
+    b"\r\n"
+    b"\r\n"
+    b"--boundary--\r\n"
+    b"epilogue"
+)
+
+
+def chunked(data: bytes, size: int):
+    async def stream() -> AsyncIterator[bytes]:
+        for index in range(0, len(data), size):
+            yield data[index : index + size]
+
+    return stream
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, len(MULTIPART_BODY)])
+async def test_request_multipart(chunk_size: int):
+    app = App()
+    headers = as_real_headers({"Content-Type": 'multipart/form-data; boundary="boundary"'})
+    request = Request(chunked(MULTIPART_BODY, chunk_size), app, "/", Method.POST, headers)
+
+    parts = [(part.name, part.filename, part.content_type, await part.read()) async for part in request.multipart()]
+    assert parts == [
+        ("field", None, "text/plain", b"value"),
+        ("file", 'a "b".txt', "application/octet-stream", b"\r\n--boundar\r\n-- data"),
+        ("unicode", "naïve.txt", "text/plain", b""),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_request_multipart_skipping():
+    app = App()
+    headers = as_real_headers({"Content-Type": "multipart/form-data; boundary=boundary"})
+    request = Request(chunked(MULTIPART_BODY, 3), app, "/", Method.POST, headers)
+
+    names = []
+    async for part in request.multipart():
+        names.append(part.name)
+        if part.name == "file":
+            stream = part.stream()
+            assert (await stream.__anext__()).startswith(b"\r\n")
+
+    assert names == ["field", "file", "unicode"]
+    with pytest.raises(BodyAlreadyUsedError):
+        part.stream()
+
+
+@pytest.mark.asyncio
+async def test_request_multipart_limits():
+    app = App()
+    data = os.urandom(4096)
+    body = (
+        b"--b\r\nContent-Disposition: form-data; name=upload; filename=x\r\n\r\n"
+        + data
+        + b"\r\n--b--"
+    )
+    headers = as_real_headers({"Content-Type": "multipart/form-data; boundary=b"})
+
+    request = Request(chunked(body, 1000), app, "/", Method.POST, headers)
+    async for part in request.multipart(MultipartSettings(spool_size=1024)):
+        file = await part.spool()
+        assert file._rolled
+        assert file.read() == data
+
+    request = Request(chunked(body, 1000), app, "/", Method.POST, headers)
+    with pytest.raises(ContentTooLarge):
+        async for part in request.multipart(MultipartSettings(max_part_size=4095)):
+            await part.read()
+
+    request = Request(chunked(body[:-3], 1000), app, "/", Method.POST, headers)
+    with pytest.raises(InvalidMultipartError):
+        async for part in request.multipart():
+            await part.read()
+
+    request = Request(chunked(body, 1000), app, "/", Method.POST, as_real_headers(None))
+    with pytest.raises(InvalidMultipartError):
+        request.multipart()
+
+
+FORM_BODY = b"name=J%C3%BCrgen+M&empty=&flag&tags=a&tags=b%26c&%3D=%3D&bad=%FF"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 5, len(FORM_BODY)])
+async def test_request_form(chunk_size: int):
+    app = App()
+    request = Request(chunked(FORM_BODY, chunk_size), app, "/", Method.POST, as_real_headers(None))
+    form = await request.form()
+
+    assert form.as_sequence() == urllib.parse.parse_qsl(FORM_BODY.decode())
+    assert form["name"] == "Jürgen M"
+    assert form.get_many("tags") == ["a", "b&c"]
+    assert "empty" not in form
+    assert form == extract_query_parameters(FORM_BODY)
+
+
+@pytest.mark.asyncio
+async def test_request_form_limit():
+    app = App()
+    request = Request(chunked(b"a=1&b=2", 2), app, "/", Method.POST, as_real_headers(None))
+    with pytest.raises(ContentTooLarge):
+        await request.form(max_size=6)
+
+    headers = as_real_headers({"Content-Length": "100"})
+    request = Request(chunked(b"a=1", 2), app, "/", Method.POST, headers)
+    with pytest.raises(ContentTooLarge):
+        await request.form(max_size=10)
+    assert not request.consumed
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+@pytest.mark.parametrize("ndjson", [None, False, True])
+async def test_request_json_stream(chunk_size: int, ndjson):
+    app = App()
+    records = [{"id": 1, "text": "a\nb ✓"}, [1, 2.5, None], 12345, "x", True, {}]
+    if ndjson:
+        body = b"".join(json.dumps(record).encode() + b"\n" for record in records)
+    else:
+        body = (" \n[ " + " , ".join(json.dumps(record, ensure_ascii=False) for record in records) + " ] \n").encode()
+
+    request = Request(chunked(body, chunk_size), app, "/", Method.POST, as_real_headers(None))
+    assert [item async for item in request.json_stream(ndjson=ndjson)] == records
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1000])
+async def test_request_json_stream_numbers(chunk_size: int):
+    app = App()
+    numbers = [2.5, 1e5, 2.5e-3, -0.5, 1e100, 0, -12, 3.25e10]
+    body = b"[2.5,1E5,2.5e-3,-0.5,1e+100,0,-12,3.25E10]"
+    request = Request(chunked(body, chunk_size), app, "/", Method.POST, as_real_headers(None))
+    assert [item async for item in request.json_stream()] == numbers
+
+
+@pytest.mark.asyncio
+async def test_request_json_stream_array_records():
+    app = App()
+    body = b"[1, 2]\n[3, 4]\n"
+    request = Request(chunked(body, 4), app, "/", Method.POST, as_real_headers(None))
+    assert [item async for item in request.json_stream(ndjson=True)] == [[1, 2], [3, 4]]
+
+    # Without the hint, a leading "[" is taken to start a JSON array.
+    request = Request(chunked(body, 4), app, "/", Method.POST, as_real_headers(None))
+    with pytest.raises(InvalidJSONError):
+        async for _ in request.json_stream():
+            pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "body",
+    [b"[1, 2", b"[1,]", b"[1 2]", b"[1] 2", b'{"a": 1}\n{"b"', b"[\xff]", b"{"],
+)
+async def test_request_json_stream_invalid(body: bytes):
+    app = App()
+    request = Request(chunked(body, 2), app, "/", Method.POST, as_real_headers(None))
+    with pytest.raises(InvalidJSONError):
+        async for _ in request.json_stream():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_request_json_stream_limits():
+    app = App()
+    for body in (b'[1, "' + b"x" * 100 + b'"]', b'1\n"' + b"x" * 100 + b'"\n'):
+        request = Request(chunked(body, 10), app, "/", Method.POST, as_real_headers(None))
+        items = []
+        with pytest.raises(ContentTooLarge):
+            async for item in request.json_stream(max_item_size=50):
+                items.append(item)
+        assert items == [1]
+
+    request = Request(chunked(b"", 10), app, "/", Method.POST, as_real_headers(None))
+    assert [item async for item in request.json_stream()] == []
+
+
+@dataclass
+class Tag:
+    name: str
+    weight: float = 1.0
+
+
+@dataclass
+class Item:
+    name: str
+    price: int
+    tags: list[Tag] = field(default_factory=list)
+    kind: Literal["new", "used"] = "new"
+    parent: "Item | None" = None
+
+
+class Point(TypedDict):
+    x: int
+    y: int
+
+
+@dataclass
+class Range:
+    low: int
+    high: int
+
+    def __post_init__(self) -> None:
+        if self.low > self.high:
+            raise ValueError("low is greater than high")
+
+
+def test_compile_validator():
+    validate = compile_validator(Item)
+    assert compile_validator(Item) is validate
+
+    item = validate(
+        {
+            "name": "hat",
+            "price": 3,
+            "tags": [{"name": "red"}, {"name": "big", "weight": 2}],
+            "parent": {"name": "box", "price": 1},
+            "unknown": True,
+        }
+    )
+    assert item == Item(
+        "hat",
+        3,
+        [Tag("red"), Tag("big", 2.0)],
+        parent=Item("box", 1),
+    )
+    assert isinstance(item.tags[1].weight, float)
+
+    with pytest.raises(ValidationError) as error:
+        validate({"name": "hat", "price": True})
+    assert str(error.value) == "price: expected an integer, got boolean"
+
+    with pytest.raises(ValidationError) as error:
+        validate({"name": "hat", "price": 1, "tags": [{"name": "a"}, {}]})
+    assert error.value.path == "tags[1].name"
+
+    with pytest.raises(ValidationError) as error:
+        validate({"name": "hat", "price": 1, "kind": "broken"})
+    assert error.value.path == "kind"
+
+    with pytest.raises(ValidationError):
+        validate([])
+
+    assert compile_validator(Point)({"x": 1, "y": 2, "z": 3}) == {"x": 1, "y": 2}
+    assert compile_validator(tuple[int, str])([1, "a"]) == (1, "a")
+    assert compile_validator(dict[str, list[int]])({"a": [1]}) == {"a": [1]}
+    assert compile_validator(int | str)("a") == "a"
+
+    with pytest.raises(TypeError):
+        compile_validator(dict[int, str])
+
+    with pytest.raises(TypeError):
+        compile_validator(set[int])
+
+    with pytest.raises(ValidationError) as error:
+        compile_validator(list[Range])([{"low": 1, "high": 2}, {"low": 2, "high": 1}])
+    assert str(error.value) == "[1]: low is greater than high"
+
+
+@pytest.mark.asyncio
+async def test_request_validated_body():
+    app = App()
+
+    @app.post("/", body=Point)
+    async def main():
+        point = app.current_request().validated_body
+        return str(point["x"] + point["y"])
+
+    @app.post("/items", body=Item)
+    async def items():
+        item = app.current_request().validated_body
+        assert isinstance(item, Item)
+        return item.name
+
+    @app.post("/plain")
+    async def plain():
+        assert app.current_request().validated_body is None
+        return "ok"
+
+    assert app.router.lookup_route("/", Method.POST).route.body_validator is (
+        compile_validator(Point)
+    )
+
+    client = AppTestClient(app)
+    assert (
+        await into_tuple(client.post("/", body=b'{"x": 1, "y": 2}'))
+    ) == ok("3")
+    assert (
+        await into_tuple(client.post("/items", body=b'{"name": "a", "price": 1}'))
+    ) == ok("a")
+    assert (await into_tuple(client.post("/plain", body=b"..."))) == ok("ok")
+    assert (await into_tuple(client.post("/", body=b"..."))) == (
+        b"Request body is not valid JSON",
+        400,
+        {},
+    )
+
+    response = await client.post("/", body=b'{"x": 1}')
+    assert response.status_code == 400
+    assert (await response.body()) == b"Invalid request body: y: field is required"
+
+    @app.post("/range", body=Range)
+    async def range_view():
+        return "ok"
+
+    response = await client.post("/range", body=b'{"low": 2, "high": 1}')
+    assert response.status_code == 400
+    assert (await response.body()) == b"Invalid request body: low is greater than high"
+
+
+@pytest.mark.asyncio
+async def test_view_argument_injection():
+    app = App()
+
+    @app.get("/users/{user_id}/posts/{slug}")
+    async def post(
+        request: Request,
+        user_id: int,
+        slug: str,
+        page: Annotated[int, Query()] = 1,
+        tags: Annotated[list[str], Query("tag")] = [],
+        user_agent: Annotated[str | None, Header()] = None,
+    ):
+        assert request is app.current_request()
+        return f"{user_id + 1} {slug} {page} {tags} {user_agent}"
+
+    @app.post("/points", body=Point)
+    async def points(point: Point, scale: Annotated[float, Query()]):
+        return str((point["x"] + point["y"]) * scale)
+
+    @app.get("/token")
+    async def token(token: Annotated[str, Header("X-Token")]):
+        return token
+
+    # Generic aliases are equal to, but not the same object as, each other.
+    @app.post("/tags", body=list[Tag])
+    async def tags(tags: list[Tag]):
+        return ",".join(tag.name for tag in tags)
+
+    @app.get("/")
+    async def no_arguments():
+        return "ok"
+
+    @app.get("/defaults/{value}")
+    async def defaults(value: int, x=1, cache: dict = {}, flag: bool = True):  # noqa: B006
+        return f"{value} {x} {cache} {flag}"
+
+    @app.get("/only-defaults")
+    def only_defaults(x=1, y=2, /):
+        return str(x + y)
+
+    assert app.router.lookup_route("/", Method.GET).route.bind_arguments is None
+    assert (
+        app.router.lookup_route("/only-defaults", Method.GET).route.bind_arguments
+        is None
+    )
+
+    client = AppTestClient(app)
+    assert (await into_tuple(client.get("/users/1/posts/hello"))) == ok(
+        "2 hello 1 [] None"
+    )
+    assert (
+        await into_tuple(
+            client.get(
+                "/users/1/posts/hello?page=3&tag=a&tag=b",
+                headers={"user-agent": "test"},
+            )
+        )
+    ) == ok("2 hello 3 ['a', 'b'] test")
+    assert (
+        await into_tuple(client.post("/points?scale=0.5", body=b'{"x": 1, "y": 2}'))
+    ) == ok("1.5")
+    assert (
+        await into_tuple(client.get("/token", headers={"x-token": "secret"}))
+    ) == ok("secret")
+    assert (await into_tuple(client.get("/"))) == ok("ok")
+    assert (await into_tuple(client.get("/defaults/3"))) == ok("3 1 {} True")
+    assert (await into_tuple(client.get("/only-defaults"))) == ok("3")
+    assert (
+        await into_tuple(client.post("/tags", body=b'[{"name": "a"}, {"name": "b"}]'))
+    ) == ok("a,b")
+
+    assert (await into_tuple(client.get("/users/a/posts/hello"))) == (
+        b"Invalid path parameter 'user_id'",
+        400,
+        {},
+    )
+    assert (await into_tuple(client.get("/users/1/posts/a?page=x"))) == (
+        b"Invalid query parameter 'page'",
+        400,
+        {},
+    )
+    assert (await into_tuple(client.post("/points", body=b'{"x": 1, "y": 2}'))) == (
+        b"Missing query parameter 'scale'",
+        400,
+        {},
+    )
+    assert (await into_tuple(client.get("/token"))) == (
+        b"Missing header 'X-Token'",
+        400,
+        {},
+    )
+
+
+def test_view_argument_injection_errors():
+    app = App()
+
+    with pytest.raises(UnresolvableParameterError):
+
+        @app.get("/")
+        async def unknown(something: str):
+            return something
+
+    with pytest.raises(UnresolvableParameterError):
+
+        @app.get("/{value}")
+        async def unconvertible(value: bytes):
+            return value
+
+    with pytest.raises(UnresolvableParameterError):
+
+        @app.get("/{value}")
+        async def positional(value: str, /):
+            return value
+
+    with pytest.raises(UnresolvableParameterError, match="'value'"):
+
+        @app.get("/{value}")
+        async def undefined(value: "Undefined"):  # noqa: F821
+            return value
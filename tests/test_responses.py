@@ -1,17 +1,34 @@
 import asyncio
+import gzip
+import json
+import math
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 from view.core.app import App, as_app
+from view.core.compression import CompressionSettings, negotiate_encoding
+from view.core.events import EventBroadcaster, EventStreamResponse, ServerSentEvent
 from view.core.headers import as_real_headers
+from view.core.json_codec import AVAILABLE_CODECS, DEFAULT_CODEC, JSONCodec
 from view.core.request import Request
-from view.core.response import FileResponse, JSONResponse, Response, ResponseLike
+from view.core.response import (
+    FileResponse,
+    JSONResponse,
+    JSONStreamResponse,
+    Response,
+    ResponseLike,
+    static_response,
+)
+from view.core.static import StaticFileCache, precompress_directory
 from view.core.status_codes import (
     STATUS_EXCEPTIONS,
     STATUS_STRINGS,
     BadRequest,
+    Forbidden,
     HTTPError,
+    NotFound,
     Success,
 )
 from view.testing import AppTestClient, bad, into_tuple, ok
@@ -166,6 +183,22 @@ async def test_status_code_strings(status_exception: type[HTTPError]):
     assert (await response.body()) == message.encode("utf-8")
 
 
+@pytest.mark.asyncio
+async def test_prebuilt_error_responses():
+    first = BadRequest().as_response()
+    second = BadRequest().as_response()
+    assert first is not second
+    assert first.headers is second.headers
+    assert (await first.body()) == (await second.body()) == b"400 Bad Request"
+    assert first.content_length == 15
+    # The server adds Content-Length from content_length.
+    assert first.headers == {}
+
+    custom = BadRequest("nope").as_response()
+    assert (await custom.body()) == b"nope"
+    assert custom.headers is not first.headers
+
+
 @pytest.mark.asyncio
 async def test_internal_server_error():
     @as_app
@@ -227,3 +260,595 @@ async def test_static_files():
             200,
             {"content-type": "text/plain"},
         )
+
+
+@pytest.mark.asyncio
+async def test_compression():
+    app = App(compression=CompressionSettings(minimum_size=100))
+
+    @app.get("/")
+    async def index():
+        return "A" * 1000
+
+    @app.get("/small")
+    async def small():
+        return "A"
+
+    @app.get("/json")
+    async def json_view():
+        return JSONResponse.from_content({"data": "B" * 1000})
+
+    @app.get("/stream")
+    async def stream():
+        for _ in range(10):
+            yield "C" * 100
+
+    @app.get("/binary")
+    async def binary():
+        return "D" * 1000, 200, {"content-type": "image/png"}
+
+    client = AppTestClient(app)
+    gzip_headers = {"accept-encoding": "gzip, deflate"}
+
+    body, status, headers = await into_tuple(client.get("/", headers=gzip_headers))
+    assert status == 200
+    assert headers == {"vary": "accept-encoding", "content-encoding": "gzip"}
+    assert gzip.decompress(body) == b"A" * 1000
+
+    assert (await into_tuple(client.get("/small", headers=gzip_headers))) == (
+        b"A",
+        200,
+        {"vary": "accept-encoding"},
+    )
+    assert (await into_tuple(client.get("/"))) == (
+        b"A" * 1000,
+        200,
+        {"vary": "accept-encoding"},
+    )
+
+    response = await client.get("/json", headers=gzip_headers)
+    assert response.headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(await response.body())) == {"data": "B" * 1000}
+
+    body, _, headers = await into_tuple(client.get("/stream", headers=gzip_headers))
+    assert "vary" not in headers
+    assert body == b"C" * 1000
+
+    body, _, headers = await into_tuple(client.get("/binary", headers=gzip_headers))
+    assert headers == {"content-type": "image/png"}
+    assert body == b"D" * 1000
+
+
+@pytest.mark.asyncio
+async def test_streaming_compression():
+    app = App(compression=CompressionSettings())
+
+    @app.get("/")
+    async def index():
+        async def stream():
+            for _ in range(100):
+                yield b"<p>Hello</p>"
+
+        return Response(stream, 200, as_real_headers({"content-type": "text/html"}))
+
+    client = AppTestClient(app)
+    body, _, headers = await into_tuple(
+        client.get("/", headers={"accept-encoding": "gzip"})
+    )
+    assert headers["content-encoding"] == "gzip"
+    assert headers["vary"] == "accept-encoding"
+    assert gzip.decompress(body) == b"<p>Hello</p>" * 100
+
+
+@pytest.mark.asyncio
+async def test_compression_representation_headers():
+    # Levels that aren't given fall back to the default for that coding.
+    app = App(compression=CompressionSettings(minimum_size=100, levels={"br": 5}))
+
+    @app.get("/")
+    async def index():
+        return "A" * 1000, 200, {"etag": '"abc"'}
+
+    @app.get("/weak")
+    async def weak():
+        return "A" * 1000, 200, {"etag": 'W/"abc"'}
+
+    @app.get("/stream")
+    async def stream():
+        async def body():
+            yield b"A" * 1000
+
+        return Response(
+            body,
+            200,
+            as_real_headers({"content-type": "text/plain", "content-length": "junk"}),
+        )
+
+    client = AppTestClient(app)
+    gzip_headers = {"accept-encoding": "gzip"}
+    body, _, headers = await into_tuple(client.get("/", headers=gzip_headers))
+    assert headers["etag"] == '"abc-gzip"'
+    assert gzip.decompress(body) == b"A" * 1000
+
+    _, _, headers = await into_tuple(client.get("/weak", headers=gzip_headers))
+    assert headers["etag"] == 'W/"abc-gzip"'
+
+    _, _, headers = await into_tuple(client.get("/"))
+    assert headers["etag"] == '"abc"'
+
+    body, _, headers = await into_tuple(client.get("/stream", headers=gzip_headers))
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    assert gzip.decompress(body) == b"A" * 1000
+
+
+def test_negotiate_encoding():
+    available = ["zstd", "br", "gzip"]
+    assert negotiate_encoding("gzip", available) == "gzip"
+    assert negotiate_encoding("gzip, br", available) == "br"
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5", available) == "gzip"
+    assert negotiate_encoding("br;q=0, gzip;q=0.1", available) == "gzip"
+    assert negotiate_encoding("*", available) == "zstd"
+    assert negotiate_encoding("*, zstd;q=0", available) == "br"
+    assert negotiate_encoding("identity", available) is None
+    assert negotiate_encoding("", available) is None
+    assert negotiate_encoding("GZIP", available) == "gzip"
+    assert negotiate_encoding("gzip;q=0.8;x=1", available) == "gzip"
+    assert negotiate_encoding("gzip; x=1 ; q=0.5, br;q=0.2", available) == "gzip"
+
+
+@pytest.mark.asyncio
+async def test_precompressed_static_files():
+    app = App()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        file = Path(temporary_directory) / "a.txt"
+        file.write_text("hello" * 200)
+        Path(temporary_directory, "a.txt.gz").write_bytes(gzip.compress(b"hello" * 200))
+        Path(temporary_directory, "b.txt").write_text("world")
+
+        app.static_files("/files", temporary_directory)
+        client = AppTestClient(app)
+
+        body, status, headers = await into_tuple(
+            client.get("/files/a.txt", headers={"accept-encoding": "br, gzip"})
+        )
+        assert status == 200
+        assert headers == {
+            "vary": "accept-encoding",
+            "content-encoding": "gzip",
+            "content-type": "text/plain",
+        }
+        assert gzip.decompress(body) == b"hello" * 200
+
+        assert (await into_tuple(client.get("/files/a.txt"))) == (
+            b"hello" * 200,
+            200,
+            {"vary": "accept-encoding", "content-type": "text/plain"},
+        )
+        assert (
+            await into_tuple(
+                client.get("/files/b.txt", headers={"accept-encoding": "gzip"})
+            )
+        ) == (b"world", 200, {"content-type": "text/plain"})
+
+
+def test_precompress_directory():
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        directory = Path(temporary_directory)
+        (directory / "nested").mkdir()
+        (directory / "nested" / "large.txt").write_text("A" * 1000)
+        (directory / "small.txt").write_text("A")
+
+        written = precompress_directory(directory, encodings=["gzip"])
+        assert written == [directory / "nested" / "large.txt.gz"]
+        assert gzip.decompress(written[0].read_bytes()) == b"A" * 1000
+        assert not (directory / "small.txt.gz").exists()
+
+        # Up-to-date variants aren't rebuilt
+        assert precompress_directory(directory, encodings=["gzip"]) == []
+
+        # Codings missing from the levels use their default.
+        (directory / "nested" / "large.txt.gz").unlink()
+        written = precompress_directory(
+            directory, encodings=["gzip"], levels={"br": 11}
+        )
+        assert written == [directory / "nested" / "large.txt.gz"]
+
+
+@pytest.mark.asyncio
+async def test_static_file_cache():
+    app = App()
+    cache = StaticFileCache(max_size=10, check_interval=math.inf)
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        first = Path(temporary_directory) / "a.txt"
+        first.write_text("hello")
+        second = Path(temporary_directory) / "b.txt"
+        second.write_text("world!")
+        Path(temporary_directory, "large.txt").write_text("A" * 100)
+
+        app.static_files("/files", temporary_directory, cache=cache)
+        client = AppTestClient(app)
+
+        body, status, headers = await into_tuple(client.get("/files/a.txt"))
+        assert (body, status) == (b"hello", 200)
+        assert headers["content-type"] == "text/plain"
+        assert headers["content-length"] == "5"
+        assert headers["etag"].startswith('"')
+        assert len(cache) == 1
+        assert cache.size == 5
+
+        # Served from memory, even though the file is gone
+        first.unlink()
+        assert (await into_tuple(client.get("/files/a.txt")))[0] == b"hello"
+
+        # Too large to be cached at all
+        assert (await into_tuple(client.get("/files/large.txt")))[0] == b"A" * 100
+        assert len(cache) == 1
+
+        # The least recently used file gets evicted
+        assert (await into_tuple(client.get("/files/b.txt")))[0] == b"world!"
+        assert len(cache) == 1
+        assert cache.size == 6
+        assert (await into_tuple(client.get("/files/a.txt"))) == bad(404)
+
+        cache.check_interval = 0
+        second.write_text("changed")
+        os.utime(second, ns=(0, 0))
+        assert (await into_tuple(client.get("/files/b.txt")))[0] == b"changed"
+
+
+@pytest.mark.asyncio
+async def test_static_file_cache_precompressed():
+    app = App()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        Path(temporary_directory, "a.css").write_text("body {}")
+        Path(temporary_directory, "a.css.gz").write_bytes(gzip.compress(b"body {}"))
+
+        app.static_files("/static", temporary_directory, cache=StaticFileCache())
+        client = AppTestClient(app)
+
+        for _ in range(2):
+            body, _, headers = await into_tuple(
+                client.get("/static/a.css", headers={"accept-encoding": "gzip"})
+            )
+            assert gzip.decompress(body) == b"body {}"
+            assert headers["content-encoding"] == "gzip"
+            assert headers["vary"] == "accept-encoding"
+            assert headers["content-type"] == "text/css"
+
+            body, _, headers = await into_tuple(client.get("/static/a.css"))
+            assert body == b"body {}"
+            assert "content-encoding" not in headers
+            assert headers["vary"] == "accept-encoding"
+
+
+@pytest.mark.asyncio
+async def test_static_file_cache_compression():
+    app = App(compression=CompressionSettings(minimum_size=100))
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        Path(temporary_directory, "a.css").write_text("body {}" * 100)
+
+        app.static_files("/static", temporary_directory, cache=StaticFileCache())
+        client = AppTestClient(app)
+
+        for _ in range(2):
+            body, _, headers = await into_tuple(
+                client.get("/static/a.css", headers={"accept-encoding": "gzip"})
+            )
+            assert headers["content-encoding"] == "gzip"
+            assert "content-length" not in headers
+            assert gzip.decompress(body) == b"body {}" * 100
+
+        _, _, headers = await into_tuple(client.get("/static/a.css"))
+        assert headers["content-length"] == "700"
+
+
+@pytest.mark.asyncio
+async def test_static_response_errors():
+    app = App()
+    ready = False
+
+    @app.get("/")
+    @static_response
+    async def index():
+        if not ready:
+            return NotFound
+
+        return "ready"
+
+    @app.get("/instance")
+    @static_response
+    def instance():
+        return BadRequest("custom")
+
+    @app.error(404)
+    async def not_found():
+        return "handled", 404
+
+    client = AppTestClient(app)
+    # Errors go through the app's error handling, and aren't cached.
+    assert (await into_tuple(client.get("/"))) == (b"handled", 404, {})
+    assert (await into_tuple(client.get("/instance"))) == (b"custom", 400, {})
+
+    ready = True
+    assert (await into_tuple(client.get("/")))[0] == b"ready"
+    ready = False
+    assert (await into_tuple(client.get("/")))[0] == b"ready"
+
+
+@pytest.mark.asyncio
+async def test_static_response_compression():
+    app = App(compression=CompressionSettings(minimum_size=100))
+
+    @app.get("/")
+    @static_response
+    async def index():
+        return "A" * 1000
+
+    client = AppTestClient(app)
+    gzip_headers = {"accept-encoding": "gzip"}
+    for _ in range(2):
+        body, _, headers = await into_tuple(client.get("/", headers=gzip_headers))
+        assert "content-length" not in headers
+        assert gzip.decompress(body) == b"A" * 1000
+
+
+@pytest.mark.asyncio
+async def test_json_codec():
+    calls: list[str] = []
+
+    def encode(data) -> bytes:
+        calls.append("encode")
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    def decode(data: bytes):
+        calls.append("decode")
+        assert isinstance(data, bytes)
+        return json.loads(data)
+
+    app = App(json_codec=JSONCodec("custom", encode, decode))
+
+    @app.get("/")
+    async def index():
+        request = app.current_request()
+        return JSONResponse.from_content(await request.json())
+
+    client = AppTestClient(app)
+    response = await client.get("/", body=b'{"a": [1, 2]}')
+    assert (await response.body()) == b'{"a":[1,2]}'
+    assert calls == ["decode", "encode"]
+
+    # Outside of an app, the fastest installed codec is used
+    preferred = [name for name in ("orjson", "msgspec", "json") if name in AVAILABLE_CODECS]
+    assert DEFAULT_CODEC is AVAILABLE_CODECS[preferred[0]]
+    response = JSONResponse.from_content({1: "a"})
+    assert json.loads(response.parsed_data) == {"1": "a"}
+    response = JSONResponse.from_content({"a": 1}, parse_function=lambda data: "[]")
+    assert (await response.body()) == b"[]"
+
+
+@pytest.mark.parametrize("name", sorted(AVAILABLE_CODECS))
+def test_available_json_codecs(name: str):
+    codec = AVAILABLE_CODECS[name]
+    data = {"text": "héllo", "numbers": [1, 2.5, None, True]}
+    encoded = codec.encode(data)
+    assert isinstance(encoded, bytes)
+    assert codec.decode(encoded) == data
+    with pytest.raises(Exception):
+        codec.decode(b"{")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 10, 1024])
+async def test_json_stream_response(chunk_size: int):
+    app = App()
+    rows = [{"id": number, "name": f"row {number}"} for number in range(50)]
+
+    @app.get("/array")
+    async def array():
+        return JSONStreamResponse.from_items(rows, chunk_size=chunk_size)
+
+    @app.get("/ndjson")
+    async def ndjson():
+        async def generate():
+            for row in rows:
+                yield row
+
+        return JSONStreamResponse.from_items(generate(), ndjson=True, chunk_size=chunk_size)
+
+    @app.get("/empty")
+    async def empty():
+        return JSONStreamResponse.from_items([])
+
+    client = AppTestClient(app)
+    response = await client.get("/array")
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(await response.body()) == rows
+
+    response = await client.get("/ndjson")
+    assert response.headers["content-type"] == "application/x-ndjson"
+    body = await response.body()
+    assert body.endswith(b"\n")
+    assert [json.loads(line) for line in body.splitlines()] == rows
+
+    response = await client.get("/empty")
+    assert (await response.body()) == b"[]"
+
+
+@pytest.mark.asyncio
+async def test_static_response():
+    app = App()
+    calls = 0
+
+    @app.get("/robots.txt")
+    @static_response
+    async def robots():
+        nonlocal calls
+        calls += 1
+        return "User-agent: *", 200, {"content-type": "text/plain"}
+
+    @app.get("/health")
+    @static_response
+    def health():
+        return "ok"
+
+    client = AppTestClient(app)
+    for _ in range(3):
+        assert (await into_tuple(client.get("/robots.txt"))) == (
+            b"User-agent: *",
+            200,
+            {"content-type": "text/plain", "content-length": "13"},
+        )
+        assert (await into_tuple(client.get("/health"))) == (
+            b"ok",
+            200,
+            {"content-length": "2"},
+        )
+
+    assert calls == 1
+    first = await client.get("/health")
+    second = await client.get("/health")
+    assert first is not second
+    assert first.headers is second.headers
+
+
+@pytest.mark.asyncio
+async def test_returned_http_errors():
+    app = App()
+
+    @app.get("/class")
+    async def error_class():
+        return BadRequest
+
+    @app.get("/instance")
+    async def error_instance():
+        return BadRequest("custom")
+
+    @app.get("/handled")
+    def handled():
+        return Forbidden
+
+    @app.error(403)
+    async def forbidden():
+        return "handled", 403
+
+    @app.error(404)
+    async def not_found():
+        # Returned errors inside error views don't recurse.
+        return NotFound
+
+    client = AppTestClient(app)
+    assert (await into_tuple(client.get("/class"))) == bad(400)
+    assert (await into_tuple(client.get("/instance"))) == (b"custom", 400, {})
+    assert (await into_tuple(client.get("/handled"))) == (b"handled", 403, {})
+    assert (await into_tuple(client.get("/missing"))) == bad(404)
+
+    @as_app
+    def single(_: Request):
+        return BadRequest
+
+    assert (await into_tuple(AppTestClient(single).get("/"))) == bad(400)
+
+
+def test_server_sent_event_encoding():
+    assert ServerSentEvent("hello").encode() == b"data: hello\n\n"
+    assert ServerSentEvent("a\nb\r\nc", event="update", id="1", retry=500).encode() == (
+        b"event: update\nid: 1\nretry: 500\ndata: a\ndata: b\ndata: c\n\n"
+    )
+
+    with pytest.raises(ValueError):
+        ServerSentEvent("data", event="bad\nevent").encode()
+
+
+@pytest.mark.asyncio
+async def test_event_stream_response():
+    app = App(compression=CompressionSettings(content_types=frozenset({"text/event-stream"})))
+
+    @app.get("/")
+    async def index():
+        async def events():
+            yield "one"
+            yield ServerSentEvent("two", event="count")
+            yield b"data: three\n\n"
+
+        return EventStreamResponse.from_events(events())
+
+    @app.get("/sync")
+    async def sync():
+        return EventStreamResponse.from_events(["a\nb"], heartbeat=None)
+
+    client = AppTestClient(app)
+    body, status, headers = await into_tuple(
+        client.get("/", headers={"accept-encoding": "gzip"})
+    )
+    assert status == 200
+    assert headers == {"content-type": "text/event-stream", "cache-control": "no-cache"}
+    assert body == b"data: one\n\nevent: count\ndata: two\n\ndata: three\n\n"
+
+    body, _, _ = await into_tuple(client.get("/sync"))
+    assert body == b"data: a\ndata: b\n\n"
+
+
+@pytest.mark.asyncio
+async def test_event_stream_heartbeat():
+    closed = False
+
+    async def events():
+        nonlocal closed
+        try:
+            await asyncio.sleep(0.05)
+            yield "late"
+            await asyncio.sleep(10)
+            yield "never"
+        finally:
+            closed = True
+
+    response = EventStreamResponse.from_events(events(), heartbeat=0.01)
+    chunks = response.stream_body()
+    received = []
+    async for data in chunks:
+        received.append(data)
+        if data != b": heartbeat\n\n":
+            break
+
+    assert received[-1] == b"data: late\n\n"
+    assert received.count(b": heartbeat\n\n") >= 2
+
+    # Closing the stream cancels the producer, even while it's waiting.
+    await chunks.aclose()
+    assert closed
+
+
+@pytest.mark.asyncio
+async def test_event_broadcaster():
+    hub = EventBroadcaster(max_pending=2)
+    first = hub.response(heartbeat=None).stream_body()
+    second = hub.subscribe()
+
+    first_event = asyncio.ensure_future(first.__anext__())
+    second_event = asyncio.ensure_future(second.__anext__())
+    await asyncio.sleep(0)
+    assert len(hub) == 2
+
+    hub.publish(ServerSentEvent("hello", id="1"))
+    assert (await first_event) == b"id: 1\ndata: hello\n\n"
+    # Both subscribers share the same encoded event.
+    assert (await second_event) is first_event.result()
+
+    # A subscriber that falls too far behind gets disconnected.
+    for number in range(3):
+        hub.publish(str(number))
+
+    assert len(hub) == 0
+    assert [data async for data in second] == []
+
+    third = hub.subscribe()
+    third_event = asyncio.ensure_future(third.__anext__())
+    await asyncio.sleep(0)
+    hub.close()
+    with pytest.raises(StopAsyncIteration):
+        await third_event
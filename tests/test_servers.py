@@ -1,3 +1,5 @@
+import asyncio
+import io
 import subprocess
 import sys
 import time
@@ -5,9 +7,10 @@ import platform
 
 import pytest
 import requests
-from view.core.app import as_app
-from view.core.request import Request
-from view.core.response import ResponseLike
+from view.core.app import App, as_app
+from view.core.events import EventStreamResponse
+from view.core.request import Request, RequestPool
+from view.core.response import JSONResponse, ResponseLike
 from view.core.status_codes import Success
 from view.run.servers import ServerSettings
 
@@ -64,3 +67,251 @@ def test_run_server_detached(server_name: str):
         assert response.headers["baz"] == "silly"
     finally:
         process.kill()
+
+
+async def call_asgi(
+    app,
+    path: str = "/",
+    *,
+    headers=(),
+    body: bytes = b"",
+    coalesce_size: int = 0,
+    request_pool=None,
+):
+    messages = []
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if body_sent:
+            # Like a real server, wait until the client disconnects.
+            await asyncio.Event().wait()
+
+        body_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": list(headers),
+        "client": None,
+        "server": None,
+    }
+    asgi = app.asgi(coalesce_size=coalesce_size, request_pool=request_pool)
+    await asgi(scope, receive, send)
+    return messages
+
+
+@pytest.mark.asyncio
+async def test_asgi_content_length():
+    app = App()
+
+    @app.get("/")
+    async def index():
+        return "hello"
+
+    @app.get("/json")
+    async def json_view():
+        return JSONResponse.from_content({"a": 1})
+
+    @app.get("/stream")
+    async def stream():
+        yield "a"
+        yield "b"
+
+    start, *_ = await call_asgi(app)
+    assert start["status"] == 200
+    assert (b"content-length", b"5") in start["headers"]
+
+    start, *_ = await call_asgi(app, "/json")
+    length = str(len(app.json_codec.encode({"a": 1}))).encode()
+    assert (b"content-length", length) in start["headers"]
+
+    start, *_ = await call_asgi(app, "/missing")
+    assert start["status"] == 404
+    assert (b"content-length", b"13") in start["headers"]
+
+    start, *_ = await call_asgi(app, "/stream")
+    assert not any(key == b"content-length" for key, _ in start["headers"])
+
+
+def test_wsgi_content_length():
+    app = App()
+
+    @app.get("/")
+    async def stream():
+        yield "a"
+        yield "b"
+
+    captured = []
+
+    def start_response(status, headers):
+        captured.append((status, headers))
+
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": "/",
+        "QUERY_STRING": "",
+        "wsgi.input": io.BytesIO(),
+    }
+    assert app.wsgi()(environ, start_response) == [b"ab"]
+    assert captured == [("200 OK", [("content-length", "2")])]
+
+
+@pytest.mark.asyncio
+async def test_asgi_body_messages():
+    app = App()
+
+    @app.get("/")
+    async def index():
+        return "hello"
+
+    @app.get("/stream")
+    async def stream():
+        for _ in range(10):
+            yield "ab"
+
+    @app.get("/empty")
+    async def empty():
+        return
+        yield
+
+    _, *body = await call_asgi(app)
+    assert body == [{"type": "http.response.body", "body": b"hello", "more_body": False}]
+
+    _, *body = await call_asgi(app, "/stream")
+    assert len(body) == 10
+    assert all(message["more_body"] for message in body[:-1])
+    assert body[-1] == {"type": "http.response.body", "body": b"ab", "more_body": False}
+
+    _, *body = await call_asgi(app, "/empty")
+    assert body == [{"type": "http.response.body", "body": b"", "more_body": False}]
+
+    _, *body = await call_asgi(app, "/stream", coalesce_size=8)
+    assert [message["body"] for message in body] == [b"abababab", b"abababab", b"abab"]
+    assert [message["more_body"] for message in body] == [True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_asgi_request_pool():
+    app = App()
+    seen: list[Request] = []
+
+    @app.get("/one")
+    async def one() -> ResponseLike:
+        request = app.current_request()
+        seen.append(request)
+        request.query_parameters
+        return await request.body()
+
+    @app.get("/two")
+    async def two() -> ResponseLike:
+        request = app.current_request()
+        seen.append(request)
+        assert request._query_parameters is None
+        assert request.path == "/two"
+        return await request.body()
+
+    pool = RequestPool(max_size=1)
+    first = await call_asgi(app, "/one", body=b"a", request_pool=pool)
+    assert len(pool) == 1
+    second = await call_asgi(app, "/two/", body=b"b", request_pool=pool)
+    assert seen[0] is seen[1]
+    assert first[-1]["body"] == b"a"
+    assert second[-1]["body"] == b"b"
+
+
+@pytest.mark.asyncio
+async def test_asgi_event_stream_disconnect():
+    app = App()
+    sent = asyncio.Event()
+    disconnected = asyncio.Event()
+    cancelled = False
+
+    @app.get("/")
+    async def index():
+        async def events():
+            nonlocal cancelled
+            try:
+                yield "first"
+                await asyncio.sleep(10)
+                yield "never"
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        return EventStreamResponse.from_events(events())
+
+    messages = []
+    received = 0
+
+    async def receive():
+        nonlocal received
+        received += 1
+        if received == 1:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+        if message.get("body"):
+            sent.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/",
+        "raw_path": b"/",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "client": None,
+        "server": None,
+    }
+    task = asyncio.ensure_future(app.asgi()(scope, receive, send))
+
+    # The first event is sent right away, without waiting for the next one.
+    await asyncio.wait_for(sent.wait(), 1)
+    assert messages[1] == {
+        "type": "http.response.body",
+        "body": b"data: first\n\n",
+        "more_body": True,
+    }
+
+    disconnected.set()
+    await asyncio.wait_for(task, 1)
+    assert cancelled
+    assert len(messages) == 2
+    assert (b"content-type", b"text/event-stream") in messages[0]["headers"]
+
+
+@pytest.mark.asyncio
+async def test_asgi_event_stream_end():
+    app = App()
+
+    @app.get("/")
+    async def index():
+        return EventStreamResponse.from_events(["a", "b"])
+
+    messages = await call_asgi(app)
+    assert [message.get("body", b"") for message in messages[1:]] == [
+        b"data: a\n\n",
+        b"data: b\n\n",
+        b"",
+    ]
+    assert messages[-1]["more_body"] is False